@@ -17,6 +17,9 @@
 
 set -euo pipefail
 
+# Adapters print their side effects only when this is set
+export DIOXIDE_DEMO_VERBOSE=1
+
 DEMO_DIR="$(cd "$(dirname "$0")" && pwd)"
 BLUE='\033[1;34m'
 GREEN='\033[1;32m'
@@ -0,0 +1,6 @@
+"""Demo output shared by the production adapters."""
+
+import os
+
+# Output only when DIOXIDE_DEMO_VERBOSE is set (demo.sh sets it); a no-op otherwise
+log = print if os.environ.get("DIOXIDE_DEMO_VERBOSE") else lambda *args, **kwargs: None
@@ -9,6 +9,8 @@ from ports import AuditLogPort, NotificationPort
 class OrderProcessor:
     """Process an order: notify the user and log it."""
 
+    __slots__ = ("_audit", "_notifier")
+
     def __init__(
         self, notifier: NotificationPort, audit: AuditLogPort
     ) -> None:
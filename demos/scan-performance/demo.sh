@@ -17,6 +17,9 @@
 
 set -euo pipefail
 
+# Adapters print their side effects only when this is set
+export DIOXIDE_DEMO_VERBOSE=1
+
 DEMO_DIR="$(cd "$(dirname "$0")" && pwd)"
 REPO_DIR="$(cd "$DEMO_DIR/../.." && pwd)"
 PYTHON="$REPO_DIR/.venv/bin/python"
@@ -7,10 +7,11 @@ time.sleep(0.4)
 
 from dioxide import adapter
 
+from myapp.output import log
 from myapp.ports import AnalyticsPort
 
 
 @adapter.for_(AnalyticsPort)
 class SegmentAdapter:
     def track(self, event: str) -> None:
-        print(f"  Tracked: {event}")
+        log(f"  Tracked: {event}")
@@ -7,10 +7,11 @@ time.sleep(0.4)
 
 from dioxide import adapter
 
+from myapp.output import log
 from myapp.ports import EmailPort
 
 
 @adapter.for_(EmailPort)
 class SendGridAdapter:
     def send(self, to: str, body: str) -> None:
-        print(f"  Sent email to {to}")
+        log(f"  Sent email to {to}")
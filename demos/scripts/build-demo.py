@@ -7,10 +7,15 @@ then builds a demo script with sleep values that match each segment.
 Usage:
     python scripts/build-demo.py <narration-script.md> <demo-name>
 
+Environment variables:
+    ELEVENLABS_API_KEY          Your ElevenLabs API key (required)
+    ELEVENLABS_VOICE_ID         Voice ID to use for synthesis (required)
+    ELEVENLABS_MAX_CONCURRENCY  Concurrent API requests (default: 2)
+
 Flow:
     1. Parse narration script into labeled segments
-    2. Generate audio for each segment via ElevenLabs
-    3. Measure each clip's duration with ffprobe
+    2. Generate audio for each segment via ElevenLabs (requests run concurrently)
+    3. Measure each clip's duration from its MP3 headers (ffprobe fallback)
     4. Write timing JSON file
     5. Concatenate clips into one narration track
 """
@@ -20,21 +25,27 @@ from __future__ import annotations
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.error import HTTPError
 from urllib.request import Request, urlopen
 
+# "<!-- SEGMENT: name -->" markers followed by that segment's narration text
+_SEGMENT_RE = re.compile(r"<!--\s*SEGMENT:\s*(\w+)\s*-->\s*\n(.*?)(?=<!--\s*SEGMENT:|\Z)", re.DOTALL)
+
+# Concurrent ElevenLabs requests; most plans allow only 2-5 at a time
+DEFAULT_MAX_CONCURRENCY = 2
+
 
 def parse_segments(script_path: Path) -> list[dict[str, str]]:
     """Parse a narration script into labeled segments."""
     content = script_path.read_text()
     segments: list[dict[str, str]] = []
 
-    pattern = re.compile(r"<!--\s*SEGMENT:\s*(\w+)\s*-->\s*\n(.*?)(?=<!--\s*SEGMENT:|\Z)", re.DOTALL)
-
-    for match in pattern.finditer(content):
+    for match in _SEGMENT_RE.finditer(content):
         name = match.group(1)
         text = match.group(2).strip()
         if text:
@@ -69,15 +80,80 @@ def generate_segment_audio(
     try:
         with urlopen(request) as response:  # noqa: S310
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(response.read())
+            with output_path.open("wb") as audio_file:
+                shutil.copyfileobj(response, audio_file, 64 * 1024)
     except HTTPError as exc:
         body = exc.read().decode("utf-8", errors="replace")
-        print(f"  ElevenLabs API error (HTTP {exc.code}): {body}", file=sys.stderr)
-        sys.exit(1)
+        msg = f"ElevenLabs API error (HTTP {exc.code}): {body}"
+        raise RuntimeError(msg) from exc
+
+
+# MPEG audio Layer III lookup tables, indexed by header bit fields
+_MP3_BITRATES_KBPS = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    1: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    25: (11025, 12000, 8000),
+}
+
+
+def read_mp3_duration(path: Path) -> float | None:
+    """Read an MP3's duration from its frame headers without spawning ffprobe.
+
+    Uses the frame count from a Xing/Info or VBRI header when present, and
+    falls back to file size / bitrate for plain CBR streams. Returns None
+    when the file is not a Layer III stream this parser understands.
+    """
+    data = path.read_bytes()
+    offset = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        offset = 10 + (((data[6] & 0x7F) << 21) | ((data[7] & 0x7F) << 14) | ((data[8] & 0x7F) << 7) | (data[9] & 0x7F))
+        if data[5] & 0x10:
+            offset += 10
+
+    if len(data) < offset + 4 or data[offset] != 0xFF or data[offset + 1] & 0xE0 != 0xE0:
+        return None
+
+    header = int.from_bytes(data[offset:offset + 4], "big")
+    version = {3: 1, 2: 2, 0: 25}.get((header >> 19) & 0x3)
+    layer = (header >> 17) & 0x3
+    bitrate_index = (header >> 12) & 0xF
+    sample_rate_index = (header >> 10) & 0x3
+    mono = ((header >> 6) & 0x3) == 3
+    if version is None or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    samples_per_frame = 1152 if version == 1 else 576
+
+    side_info = (17 if mono else 32) if version == 1 else (9 if mono else 17)
+    xing = offset + 4 + side_info
+    if data[xing:xing + 4] in (b"Xing", b"Info") and int.from_bytes(data[xing + 4:xing + 8], "big") & 0x1:
+        frames = int.from_bytes(data[xing + 8:xing + 12], "big")
+        return frames * samples_per_frame / sample_rate
+    vbri = offset + 36
+    if data[vbri:vbri + 4] == b"VBRI":
+        frames = int.from_bytes(data[vbri + 14:vbri + 18], "big")
+        return frames * samples_per_frame / sample_rate
+
+    audio_bytes = len(data) - offset - (128 if data[-128:-125] == b"TAG" else 0)
+    bitrate = _MP3_BITRATES_KBPS[1 if version == 1 else 2][bitrate_index] * 1000
+    return audio_bytes * 8 / bitrate
 
 
 def get_audio_duration(path: Path) -> float:
-    """Get duration of an audio file in seconds using ffprobe."""
+    """Get duration of an audio file in seconds.
+
+    MP3 headers are parsed in-process; ffprobe is only spawned for files
+    the header parser does not understand.
+    """
+    duration = read_mp3_duration(path)
+    if duration is not None:
+        return duration
+
     result = subprocess.run(
         ["ffprobe", "-v", "quiet", "-show_entries", "format=duration",
          "-of", "csv=p=0", str(path)],
@@ -87,17 +163,17 @@ def get_audio_duration(path: Path) -> float:
 
 
 def concatenate_audio(clip_paths: list[Path], output_path: Path) -> None:
-    """Concatenate audio clips into a single file using ffmpeg."""
-    list_file = output_path.parent / "concat_list.txt"
-    list_file.write_text(
-        "\n".join(f"file '{p.resolve()}'" for p in clip_paths)
-    )
+    """Concatenate audio clips into a single file using ffmpeg.
+
+    The concat list is piped over stdin rather than written to a temp file.
+    """
+    concat_list = "\n".join(f"file '{p.resolve()}'" for p in clip_paths)
     subprocess.run(
         ["ffmpeg", "-y", "-f", "concat", "-safe", "0",
-         "-i", str(list_file), "-c", "copy", str(output_path)],
-        capture_output=True, check=True,
+         "-protocol_whitelist", "file,pipe",
+         "-i", "pipe:0", "-c", "copy", str(output_path)],
+        input=concat_list.encode("utf-8"), capture_output=True, check=True,
     )
-    list_file.unlink()
 
 
 def main() -> None:
@@ -120,6 +196,10 @@ def main() -> None:
     if not re.fullmatch(r"[A-Za-z0-9]+", voice_id):
         print("ELEVENLABS_VOICE_ID must be alphanumeric", file=sys.stderr)
         sys.exit(1)
+    max_concurrency = os.environ.get("ELEVENLABS_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))
+    if not max_concurrency.isdigit() or int(max_concurrency) < 1:
+        print("ELEVENLABS_MAX_CONCURRENCY must be a positive integer", file=sys.stderr)
+        sys.exit(1)
 
     demos_dir = Path(__file__).resolve().parent.parent
     clips_dir = demos_dir / "recordings" / "clips"
@@ -132,18 +212,31 @@ def main() -> None:
         sys.exit(1)
     print(f"Found {len(segments)} narration segments")
 
-    # Step 2: Generate audio for each segment
+    # Step 2: Generate audio for each segment. The requests are network-bound,
+    # so overlap them; results stay in segment order via the futures list.
     timing: list[dict[str, float | str]] = []
-    clip_paths: list[Path] = []
-
-    for seg in segments:
-        clip_path = clips_dir / f"{demo_name}_{seg['name']}.mp3"
-        print(f"  Generating: {seg['name']} ({len(seg['text'])} chars)")
-        generate_segment_audio(seg["text"], clip_path, api_key, voice_id)
-
-        # Step 3: Measure duration
-        duration = get_audio_duration(clip_path)
-        print(f"    Duration: {duration:.1f}s")
+    clip_paths = [clips_dir / f"{demo_name}_{seg['name']}.mp3" for seg in segments]
+
+    with ThreadPoolExecutor(max_workers=int(max_concurrency)) as executor:
+        futures = []
+        for seg, clip_path in zip(segments, clip_paths, strict=True):
+            print(f"  Generating: {seg['name']} ({len(seg['text'])} chars)")
+            futures.append(executor.submit(generate_segment_audio, seg["text"], clip_path, api_key, voice_id))
+        try:
+            for future in futures:
+                future.result()
+        except Exception as exc:
+            # Drop the queued requests so one failure (e.g. HTTP 429) stops the run
+            for pending in futures:
+                pending.cancel()
+            print(f"  {exc}", file=sys.stderr)
+            sys.exit(1)
+
+    # Step 3: Measure durations
+    durations = [get_audio_duration(clip_path) for clip_path in clip_paths]
+
+    for seg, clip_path, duration in zip(segments, clip_paths, durations, strict=True):
+        print(f"  {seg['name']}: {duration:.1f}s")
 
         timing.append({
             "name": seg["name"],
@@ -151,7 +244,6 @@ def main() -> None:
             "duration": round(duration, 2),
             "clip": str(clip_path.name),
         })
-        clip_paths.append(clip_path)
 
     # Step 4: Write timing JSON
     timing_path = demos_dir / "recordings" / f"{demo_name}_timing.json"
@@ -26,6 +26,9 @@ from urllib.request import (
     urlopen,
 )
 
+# Timing markers like "[00:12] " and speaker labels like "**Host**: ", stripped in one pass
+_MARKUP_RE = re.compile(r"\[[\d:]+\]\s*|\*\*.*?\*\*:\s*")
+
 
 def extract_narration_text(script_path: Path) -> str:
     """Extract plain narration text from a markdown script file.
@@ -55,8 +58,7 @@ def extract_narration_text(script_path: Path) -> str:
         if stripped.startswith("---"):
             continue
 
-        cleaned = re.sub(r"\[[\d:]+\]\s*", "", stripped)
-        cleaned = re.sub(r"\*\*.*?\*\*:\s*", "", cleaned)
+        cleaned = _MARKUP_RE.sub("", stripped)
 
         if cleaned:
             narration_lines.append(cleaned)
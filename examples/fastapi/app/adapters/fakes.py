@@ -12,11 +12,31 @@ Why fakes instead of mocks?
 - Fakes are fast - no I/O, no network calls
 """
 
+from collections.abc import Callable
+
 from dioxide import Profile, adapter
 
+from ..domain.models import User
 from ..domain.ports import DatabasePort, EmailPort
 
 
+def _succeed() -> None:
+    """Default precheck: operations proceed normally."""
+
+
+def _fail_with(error: Exception) -> Callable[[], None]:
+    """Build a precheck that makes every operation raise ``error``.
+
+    Fakes call ``self._precheck()`` at the top of each operation, so the
+    normal (not failing) path costs one call instead of a flag check.
+    """
+
+    def precheck() -> None:
+        raise error
+
+    return precheck
+
+
 @adapter.for_(DatabasePort, profile=Profile.TEST)
 class FakeDatabaseAdapter:
     """Fast in-memory fake database for testing.
@@ -31,35 +51,31 @@ class FakeDatabaseAdapter:
 
     def __init__(self) -> None:
         """Initialize with empty user storage."""
-        self.users: dict[str, dict] = {}
+        self.users: dict[str, User] = {}
         self._next_id = 1
-        self._should_fail: bool = False
-        self._fail_with: Exception | None = None
+        self._precheck: Callable[[], None] = _succeed
 
-    async def get_user(self, user_id: str) -> dict | None:
+    async def get_user(self, user_id: str) -> User | None:
         """Retrieve a user by ID from in-memory storage."""
-        if self._should_fail and self._fail_with:
-            raise self._fail_with
+        self._precheck()
         return self.users.get(user_id)
 
-    async def create_user(self, name: str, email: str) -> dict:
+    async def create_user(self, name: str, email: str) -> User:
         """Create a new user in in-memory storage."""
-        if self._should_fail and self._fail_with:
-            raise self._fail_with
+        self._precheck()
         user_id = str(self._next_id)
         self._next_id += 1
 
-        user = {"id": user_id, "name": name, "email": email}
+        user = User(id=user_id, name=name, email=email)
         self.users[user_id] = user
         return user
 
-    async def list_users(self) -> list[dict]:
+    async def list_users(self) -> list[User]:
         """List all users from in-memory storage."""
-        if self._should_fail and self._fail_with:
-            raise self._fail_with
+        self._precheck()
         return list(self.users.values())
 
-    def seed(self, *users: dict) -> None:
+    def seed(self, *users: User | dict[str, str]) -> None:
         """Pre-populate the database with test data.
 
         This avoids going through the API for test setup, making tests
@@ -69,16 +85,17 @@ class FakeDatabaseAdapter:
         prevent collisions when create_user is called afterwards.
 
         Args:
-            *users: User dictionaries, each must have "id", "name", "email"
+            *users: Users, or dictionaries with "id", "name", "email"
         """
-        for user in users:
-            self.users[user["id"]] = user
-            try:
-                seeded_id = int(user["id"])
+        for seeded in users:
+            user = seeded if isinstance(seeded, User) else User(**seeded)
+            self.users[user.id] = user
+            # isdecimal() accepts exactly the strings int() parses as digits, so
+            # non-numeric IDs are skipped without raising and catching an error
+            if isinstance(user.id, str) and user.id.isdecimal():
+                seeded_id = int(user.id)
                 if seeded_id >= self._next_id:
                     self._next_id = seeded_id + 1
-            except (ValueError, TypeError):
-                pass
 
     def configure_to_fail(self, error: Exception) -> None:
         """Configure all operations to raise the given error.
@@ -89,15 +106,13 @@ class FakeDatabaseAdapter:
         Args:
             error: Exception to raise on next operation
         """
-        self._should_fail = True
-        self._fail_with = error
+        self._precheck = _fail_with(error)
 
     def reset(self) -> None:
         """Reset to default state: clear data and stop failing."""
         self.users.clear()
         self._next_id = 1
-        self._should_fail = False
-        self._fail_with = None
+        self._precheck = _succeed
 
 
 @adapter.for_(EmailPort, profile=Profile.TEST)
@@ -118,8 +133,8 @@ class FakeEmailAdapter:
     def __init__(self) -> None:
         """Initialize with empty sent emails list."""
         self.sent_emails: list[dict[str, str]] = []
-        self._should_fail: bool = False
-        self._fail_with: Exception | None = None
+        self._welcome_recipients: set[str] = set()
+        self._precheck: Callable[[], None] = _succeed
 
     async def send_welcome_email(self, to: str, name: str) -> None:
         """Record a welcome email send.
@@ -127,23 +142,23 @@ class FakeEmailAdapter:
         Instead of actually sending an email, this records the send
         so tests can verify it happened.
         """
-        if self._should_fail and self._fail_with:
-            raise self._fail_with
+        self._precheck()
         self.sent_emails.append({"to": to, "name": name, "type": "welcome"})
+        self._welcome_recipients.add(to)
 
     def clear(self) -> None:
         """Clear all recorded emails."""
         self.sent_emails.clear()
+        self._welcome_recipients.clear()
 
     def was_welcome_email_sent_to(self, email: str) -> bool:
         """Check if a welcome email was sent to a specific address.
 
         This is a convenience method for tests -- cleaner than manually
-        searching the sent_emails list.
+        searching the sent_emails list. Recipients are tracked in a set as
+        emails are sent, so the check is a constant-time membership test.
         """
-        return any(
-            e["to"] == email and e["type"] == "welcome" for e in self.sent_emails
-        )
+        return email in self._welcome_recipients
 
     def configure_to_fail(self, error: Exception) -> None:
         """Configure send operations to raise the given error.
@@ -154,11 +169,10 @@ class FakeEmailAdapter:
         Args:
             error: Exception to raise on next send
         """
-        self._should_fail = True
-        self._fail_with = error
+        self._precheck = _fail_with(error)
 
     def reset(self) -> None:
         """Reset to default state: clear emails and stop failing."""
         self.sent_emails.clear()
-        self._should_fail = False
-        self._fail_with = None
+        self._welcome_recipients.clear()
+        self._precheck = _succeed
@@ -14,6 +14,7 @@ from typing import Any
 
 from dioxide import Profile, adapter, lifecycle
 
+from ..domain.models import User
 from ..domain.ports import ConfigPort, DatabasePort
 
 
@@ -52,7 +53,8 @@ class PostgresAdapter:
             "DATABASE_URL", "postgresql://localhost/dioxide_example"
         )
         self.pool: Any | None = None
-        self._users_table: dict[str, dict] = {}  # Mock storage for demo
+        self._users_table: dict[str, User] = {}  # Mock storage for demo
+        self._next_id = 1
 
     async def initialize(self) -> None:
         """Initialize database connection pool.
@@ -87,7 +89,7 @@ class PostgresAdapter:
             self.pool = None
             print("[PostgresAdapter] Connection pool closed")
 
-    async def get_user(self, user_id: str) -> dict | None:
+    async def get_user(self, user_id: str) -> User | None:
         """Retrieve a user by ID from PostgreSQL.
 
         In production, this would execute:
@@ -95,18 +97,18 @@ class PostgresAdapter:
                 row = await conn.fetchrow(
                     "SELECT * FROM users WHERE id = $1", user_id
                 )
-                return dict(row) if row else None
+                return User(**row) if row else None
 
         Args:
             user_id: Unique identifier for the user
 
         Returns:
-            User dictionary if found, None otherwise
+            User if found, None otherwise
         """
         # Mock implementation - replace with real SQL query
         return self._users_table.get(user_id)
 
-    async def create_user(self, name: str, email: str) -> dict:
+    async def create_user(self, name: str, email: str) -> User:
         """Create a new user in PostgreSQL.
 
         In production, this would execute:
@@ -115,31 +117,32 @@ class PostgresAdapter:
                     "INSERT INTO users (name, email) VALUES ($1, $2) RETURNING *",
                     name, email
                 )
-                return dict(row)
+                return User(**row)
 
         Args:
             name: User's full name
             email: User's email address
 
         Returns:
-            Created user dictionary with ID
+            Created user with ID
         """
         # Mock implementation - replace with real SQL insert
-        user_id = str(len(self._users_table) + 1)
-        user = {"id": user_id, "name": name, "email": email}
+        user_id = str(self._next_id)
+        self._next_id += 1
+        user = User(id=user_id, name=name, email=email)
         self._users_table[user_id] = user
         return user
 
-    async def list_users(self) -> list[dict]:
+    async def list_users(self) -> list[User]:
         """List all users from PostgreSQL.
 
         In production, this would execute:
             async with self.pool.acquire() as conn:
                 rows = await conn.fetch("SELECT * FROM users ORDER BY id")
-                return [dict(row) for row in rows]
+                return [User(**row) for row in rows]
 
         Returns:
-            List of user dictionaries
+            List of users
         """
         # Mock implementation - replace with real SQL query
         return list(self._users_table.values())
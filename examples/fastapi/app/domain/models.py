@@ -0,0 +1,20 @@
+"""Domain records shared by ports, services, and adapters.
+
+Records are plain data with no framework dependencies. The HTTP layer
+converts them to response models at the boundary.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class User:
+    """A registered user.
+
+    Declared with ``slots=True`` so each instance stores its three fields
+    directly instead of carrying a per-instance ``__dict__``.
+    """
+
+    id: str
+    name: str
+    email: str
@@ -6,6 +6,8 @@ protocol definitions with no implementation details or framework dependencies.
 
 from typing import Protocol
 
+from .models import User
+
 
 class ConfigPort(Protocol):
     """Port for application configuration.
@@ -40,18 +42,18 @@ class DatabasePort(Protocol):
     in-memory store for testing.
     """
 
-    async def get_user(self, user_id: str) -> dict | None:
+    async def get_user(self, user_id: str) -> User | None:
         """Retrieve a user by ID.
 
         Args:
             user_id: Unique identifier for the user
 
         Returns:
-            User dictionary if found, None otherwise
+            User if found, None otherwise
         """
         ...
 
-    async def create_user(self, name: str, email: str) -> dict:
+    async def create_user(self, name: str, email: str) -> User:
         """Create a new user.
 
         Args:
@@ -59,15 +61,15 @@ class DatabasePort(Protocol):
             email: User's email address
 
         Returns:
-            Created user dictionary with ID
+            Created user with ID
         """
         ...
 
-    async def list_users(self) -> list[dict]:
+    async def list_users(self) -> list[User]:
         """List all users.
 
         Returns:
-            List of user dictionaries
+            List of users
         """
         ...
 
@@ -4,10 +4,11 @@ Services are framework-agnostic and depend only on ports (interfaces), not
 concrete implementations. This makes them highly testable and portable.
 """
 
-import uuid
+import secrets
 
 from dioxide import Scope, service
 
+from .models import User
 from .ports import DatabasePort, EmailPort
 
 
@@ -21,7 +22,7 @@ class RequestContext:
     """
 
     def __init__(self) -> None:
-        self.request_id = str(uuid.uuid4())
+        self.request_id = secrets.token_hex(16)
 
 
 @service
@@ -43,7 +44,7 @@ class UserService:
         self.db = db
         self.email = email
 
-    async def register_user(self, name: str, email: str) -> dict:
+    async def register_user(self, name: str, email: str) -> User:
         """Register a new user and send welcome email.
 
         This is the core business logic: create user, then notify them.
@@ -55,12 +56,12 @@ class UserService:
             email: User's email address
 
         Returns:
-            Created user dictionary
+            Created user
 
         Example:
             >>> service = container.resolve(UserService)
             >>> user = await service.register_user("Alice", "alice@example.com")
-            >>> print(user["name"])
+            >>> print(user.name)
             Alice
         """
         # Business logic: create user first
@@ -71,21 +72,21 @@ class UserService:
 
         return user
 
-    async def get_user(self, user_id: str) -> dict | None:
+    async def get_user(self, user_id: str) -> User | None:
         """Retrieve a user by ID.
 
         Args:
             user_id: Unique identifier for the user
 
         Returns:
-            User dictionary if found, None otherwise
+            User if found, None otherwise
         """
         return await self.db.get_user(user_id)
 
-    async def list_all_users(self) -> list[dict]:
+    async def list_all_users(self) -> list[User]:
         """List all registered users.
 
         Returns:
-            List of user dictionaries
+            List of users
         """
         return await self.db.list_users()
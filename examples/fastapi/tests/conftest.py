@@ -204,25 +204,16 @@ def clear_fakes(client) -> None:
     3. No coupling to fake implementation details
 
     Note:
-        This fixture uses hasattr checks to handle cases where the
-        container might have different adapter implementations.
+        Both fakes expose ``reset()``, which clears stored data and any
+        injected failures, so the fixture calls it directly on each adapter.
     """
     # Get adapters from container (safe now - client fixture ensures lifespan ran)
-    db_adapter = container.resolve(DatabasePort)
-    email_adapter = container.resolve(EmailPort)
+    db_adapter: FakeDatabaseAdapter = container.resolve(DatabasePort)  # type: ignore[assignment]
+    email_adapter: FakeEmailAdapter = container.resolve(EmailPort)  # type: ignore[assignment]
 
     # Reset fakes to clean state (clears data AND error injection)
-    if hasattr(db_adapter, "reset"):
-        db_adapter.reset()
-    elif hasattr(db_adapter, "users"):
-        db_adapter.users.clear()
-        if hasattr(db_adapter, "_next_id"):
-            db_adapter._next_id = 1
-
-    if hasattr(email_adapter, "reset"):
-        email_adapter.reset()
-    elif hasattr(email_adapter, "sent_emails"):
-        email_adapter.sent_emails.clear()
+    db_adapter.reset()
+    email_adapter.reset()
 
 
 # =============================================================================
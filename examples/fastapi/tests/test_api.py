@@ -35,7 +35,7 @@ class DescribeUserCreation:
         # Verify user was stored (checking fake state)
         stored_user = db.users.get(user["id"])
         assert stored_user is not None
-        assert stored_user["name"] == "Alice Smith"
+        assert stored_user.name == "Alice Smith"
 
         # Verify welcome email was sent (checking fake state)
         assert len(email.sent_emails) == 1
@@ -212,6 +212,16 @@ class DescribeFakeConvenience:
         # This is cleaner than:
         # assert any(e["to"] == "alice@example.com" for e in email.sent_emails)
 
+    def it_forgets_welcome_recipients_after_clear(
+        self, client: TestClient, email: EmailPort
+    ) -> None:
+        """clear() resets what was_welcome_email_sent_to() reports."""
+        client.post("/users", json={"name": "Alice", "email": "alice@example.com"})
+
+        email.clear()
+
+        assert not email.was_welcome_email_sent_to("alice@example.com")
+
 
 class DescribeSeedHelper:
     """Tests demonstrating seed() helper for pre-populating test data."""
@@ -296,3 +306,18 @@ class DescribeErrorInjection:
         )
 
         assert response.status_code == 201
+
+    def it_accepts_non_numeric_seeded_ids(
+        self, client: TestClient, db: DatabasePort
+    ) -> None:
+        """seed() stores non-numeric IDs without advancing the ID counter."""
+        db.seed(
+            {"id": "admin", "name": "Admin", "email": "admin@example.com"},
+        )
+
+        response = client.post(
+            "/users", json={"name": "New User", "email": "new@example.com"}
+        )
+
+        assert response.json()["id"] == "1"
+        assert client.get("/users/admin").json()["name"] == "Admin"
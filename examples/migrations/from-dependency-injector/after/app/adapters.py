@@ -5,6 +5,7 @@ Profile-based registration replaces manual container overrides.
 """
 
 import os
+from itertools import count
 
 from dioxide import Profile, adapter
 
@@ -19,20 +20,21 @@ class PostgresUserRepository:
     This follows 12-Factor App principles.
     """
 
+    __slots__ = ("_ids", "_users", "connection_string")
+
     def __init__(self) -> None:
         self.connection_string = os.environ.get(
             "DATABASE_URL", "postgresql://localhost/mydb"
         )
         self._users: dict[str, dict] = {}
-        self._next_id = 1
+        self._ids = count(1)
 
     async def get(self, user_id: str) -> dict | None:
         return self._users.get(user_id)
 
     async def save(self, user: dict) -> dict:
         if "id" not in user:
-            user["id"] = str(self._next_id)
-            self._next_id += 1
+            user["id"] = str(next(self._ids))
         self._users[user["id"]] = user
         return user
 
@@ -47,6 +49,8 @@ class PostgresUserRepository:
 class SendGridEmailAdapter:
     """SendGrid implementation of EmailPort."""
 
+    __slots__ = ("api_key",)
+
     def __init__(self) -> None:
         self.api_key = os.environ.get("SENDGRID_API_KEY", "")
 
@@ -59,6 +63,8 @@ class SendGridEmailAdapter:
 class RedisCacheAdapter:
     """Redis implementation of CachePort."""
 
+    __slots__ = ("_cache", "redis_url")
+
     def __init__(self) -> None:
         self.redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379")
         self._cache: dict[str, str] = {}
@@ -81,17 +87,18 @@ class FakeUserRepository:
     No container overrides needed.
     """
 
+    __slots__ = ("_ids", "_users")
+
     def __init__(self) -> None:
         self._users: dict[str, dict] = {}
-        self._next_id = 1
+        self._ids = count(1)
 
     async def get(self, user_id: str) -> dict | None:
         return self._users.get(user_id)
 
     async def save(self, user: dict) -> dict:
         if "id" not in user:
-            user["id"] = str(self._next_id)
-            self._next_id += 1
+            user["id"] = str(next(self._ids))
         self._users[user["id"]] = user
         return user
 
@@ -109,13 +116,15 @@ class FakeUserRepository:
     def clear(self) -> None:
         """Clear all users."""
         self._users.clear()
-        self._next_id = 1
+        self._ids = count(1)
 
 
 @adapter.for_(EmailPort, profile=Profile.TEST)
 class FakeEmailAdapter:
     """In-memory fake for testing."""
 
+    __slots__ = ("sent_emails",)
+
     def __init__(self) -> None:
         self.sent_emails: list[dict] = []
 
@@ -132,6 +141,8 @@ class FakeEmailAdapter:
 class FakeCacheAdapter:
     """In-memory fake for testing."""
 
+    __slots__ = ("_cache",)
+
     def __init__(self) -> None:
         self._cache: dict[str, str] = {}
 
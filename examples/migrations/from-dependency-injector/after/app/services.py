@@ -4,6 +4,8 @@ The @service decorator replaces dependency-injector's provider wiring.
 Dependencies are resolved automatically from type hints.
 """
 
+import json
+
 from dioxide import service
 
 from app.ports import CachePort, EmailPort, UserRepositoryPort
@@ -19,6 +21,8 @@ class UserService:
     No @inject decorator needed - just use type hints.
     """
 
+    __slots__ = ("_cache", "_email", "_repository")
+
     def __init__(
         self,
         repository: UserRepositoryPort,
@@ -31,17 +35,14 @@ class UserService:
 
     async def get_user(self, user_id: str) -> dict | None:
         """Get a user, checking cache first."""
-        cached = await self._cache.get(f"user:{user_id}")
+        key = f"user:{user_id}"
+        cached = await self._cache.get(key)
         if cached:
-            import json
-
             return json.loads(cached)
 
         user = await self._repository.get(user_id)
         if user:
-            import json
-
-            await self._cache.set(f"user:{user_id}", json.dumps(user))
+            await self._cache.set(key, json.dumps(user))
         return user
 
     async def create_user(self, name: str, email: str) -> dict:
@@ -8,15 +8,28 @@ With dioxide, testing is simpler:
 import pytest
 
 import app.adapters as _adapters  # noqa: F401 — register adapters
+from app.ports import CachePort, EmailPort, UserRepositoryPort
 from dioxide import Container, Profile
 
 
+@pytest.fixture(scope="session")
+def _test_container() -> Container:
+    """Build the test-profile container once for the whole session.
+
+    Registration and adapter selection happen here a single time; every test
+    then reuses the same container and its singleton fakes.
+    """
+    return Container(profile=Profile.TEST)
+
+
 @pytest.fixture
-def container() -> Container:
-    """Create a fresh container with test profile.
+def container(_test_container: Container) -> Container:
+    """Return the shared test container with every fake reset.
 
     No provider overrides needed - Profile.TEST automatically
-    selects the fake adapters.
+    selects the fake adapters. Clearing the fakes gives each test the
+    same clean state a fresh container would.
     """
-    c = Container(profile=Profile.TEST)
-    return c
+    for port in (UserRepositoryPort, EmailPort, CachePort):
+        _test_container.resolve(port).clear()
+    return _test_container
@@ -1,23 +1,26 @@
 """Adapter implementations for dependency-injector example."""
 
+from itertools import count
+
 from app.ports import CacheService, EmailService, UserRepository
 
 
 class PostgresUserRepository(UserRepository):
     """PostgreSQL implementation of UserRepository."""
 
+    __slots__ = ("_ids", "_users", "connection_string")
+
     def __init__(self, connection_string: str) -> None:
         self.connection_string = connection_string
         self._users: dict[str, dict] = {}
-        self._next_id = 1
+        self._ids = count(1)
 
     async def get(self, user_id: str) -> dict | None:
         return self._users.get(user_id)
 
     async def save(self, user: dict) -> dict:
         if "id" not in user:
-            user["id"] = str(self._next_id)
-            self._next_id += 1
+            user["id"] = str(next(self._ids))
         self._users[user["id"]] = user
         return user
 
@@ -31,6 +34,8 @@ class PostgresUserRepository(UserRepository):
 class SendGridEmailService(EmailService):
     """SendGrid implementation of EmailService."""
 
+    __slots__ = ("api_key",)
+
     def __init__(self, api_key: str) -> None:
         self.api_key = api_key
 
@@ -42,6 +47,8 @@ class SendGridEmailService(EmailService):
 class RedisCacheService(CacheService):
     """Redis implementation of CacheService."""
 
+    __slots__ = ("_cache", "redis_url")
+
     def __init__(self, redis_url: str) -> None:
         self.redis_url = redis_url
         self._cache: dict[str, str] = {}
@@ -59,17 +66,18 @@ class RedisCacheService(CacheService):
 class FakeUserRepository(UserRepository):
     """In-memory fake for testing."""
 
+    __slots__ = ("_ids", "_users")
+
     def __init__(self) -> None:
         self._users: dict[str, dict] = {}
-        self._next_id = 1
+        self._ids = count(1)
 
     async def get(self, user_id: str) -> dict | None:
         return self._users.get(user_id)
 
     async def save(self, user: dict) -> dict:
         if "id" not in user:
-            user["id"] = str(self._next_id)
-            self._next_id += 1
+            user["id"] = str(next(self._ids))
         self._users[user["id"]] = user
         return user
 
@@ -88,6 +96,8 @@ class FakeUserRepository(UserRepository):
 class FakeEmailService(EmailService):
     """In-memory fake for testing."""
 
+    __slots__ = ("sent_emails",)
+
     def __init__(self) -> None:
         self.sent_emails: list[dict] = []
 
@@ -99,6 +109,8 @@ class FakeEmailService(EmailService):
 class FakeCacheService(CacheService):
     """In-memory fake for testing."""
 
+    __slots__ = ("_cache",)
+
     def __init__(self) -> None:
         self._cache: dict[str, str] = {}
 
@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 class UserRepository(ABC):
     """Abstract base class for user persistence."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def get(self, user_id: str) -> dict | None:
         """Get a user by ID."""
@@ -28,6 +30,8 @@ class UserRepository(ABC):
 class EmailService(ABC):
     """Abstract base class for email sending."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def send(self, to: str, subject: str, body: str) -> bool:
         """Send an email."""
@@ -37,6 +41,8 @@ class EmailService(ABC):
 class CacheService(ABC):
     """Abstract base class for caching."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def get(self, key: str) -> str | None:
         """Get a value from cache."""
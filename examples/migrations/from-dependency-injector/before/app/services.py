@@ -1,5 +1,7 @@
 """Business logic services using dependency-injector patterns."""
 
+import json
+
 from app.ports import CacheService, EmailService, UserRepository
 
 
@@ -10,6 +12,8 @@ class UserService:
     The container wires these using providers.
     """
 
+    __slots__ = ("_cache", "_email", "_repository")
+
     def __init__(
         self,
         repository: UserRepository,
@@ -22,17 +26,14 @@ class UserService:
 
     async def get_user(self, user_id: str) -> dict | None:
         """Get a user, checking cache first."""
-        cached = await self._cache.get(f"user:{user_id}")
+        key = f"user:{user_id}"
+        cached = await self._cache.get(key)
         if cached:
-            import json
-
             return json.loads(cached)
 
         user = await self._repository.get(user_id)
         if user:
-            import json
-
-            await self._cache.set(f"user:{user_id}", json.dumps(user))
+            await self._cache.set(key, json.dumps(user))
         return user
 
     async def create_user(self, name: str, email: str) -> dict:
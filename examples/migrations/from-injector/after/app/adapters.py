@@ -4,10 +4,14 @@ The @adapter.for_() decorator replaces injector's Module/Binder configuration.
 Profile-based registration replaces separate production/test modules.
 """
 
+import logging
+
 from dioxide import Profile, Scope, adapter
 
 from app.ports import NotificationPort, Order, OrderRepositoryPort, PaymentGatewayPort
 
+logger = logging.getLogger(__name__)
+
 
 @adapter.for_(OrderRepositoryPort, profile=Profile.PRODUCTION, scope=Scope.SINGLETON)
 class PostgresOrderRepository:
@@ -15,16 +19,28 @@ class PostgresOrderRepository:
 
     def __init__(self) -> None:
         self._orders: dict[str, Order] = {}
+        # Orders per customer, keyed by order ID to keep insertion order on re-save
+        self._by_customer: dict[str, dict[str, Order]] = {}
 
     async def get(self, order_id: str) -> Order | None:
         return self._orders.get(order_id)
 
     async def save(self, order: Order) -> Order:
-        self._orders[order.id] = order
+        self._store(order)
         return order
 
     async def find_by_customer(self, customer_id: str) -> list[Order]:
-        return [o for o in self._orders.values() if o.customer_id == customer_id]
+        return list(self._by_customer.get(customer_id, {}).values())
+
+    async def count_by_customer(self, customer_id: str) -> int:
+        return len(self._by_customer.get(customer_id, ()))
+
+    def _store(self, order: Order) -> None:
+        previous = self._orders.get(order.id)
+        if previous is not None and previous.customer_id != order.customer_id:
+            del self._by_customer[previous.customer_id][order.id]
+        self._orders[order.id] = order
+        self._by_customer.setdefault(order.customer_id, {})[order.id] = order
 
 
 @adapter.for_(NotificationPort, profile=Profile.PRODUCTION, scope=Scope.SINGLETON)
@@ -32,7 +48,7 @@ class EmailNotificationAdapter:
     """Email-based notification adapter."""
 
     async def send(self, recipient: str, message: str) -> bool:
-        print(f"[Email] Sending to {recipient}: {message}")
+        logger.debug("[Email] Sending to %s: %s", recipient, message)
         return True
 
 
@@ -41,7 +57,7 @@ class StripePaymentAdapter:
     """Stripe implementation of PaymentGatewayPort."""
 
     async def charge(self, customer_id: str, amount: float) -> dict:
-        print(f"[Stripe] Charging {customer_id} ${amount:.2f}")
+        logger.debug("[Stripe] Charging %s $%.2f", customer_id, amount)
         return {
             "transaction_id": f"txn_{customer_id}_{int(amount * 100)}",
             "status": "succeeded",
@@ -49,7 +65,7 @@ class StripePaymentAdapter:
         }
 
     async def refund(self, transaction_id: str, amount: float) -> dict:
-        print(f"[Stripe] Refunding {transaction_id} ${amount:.2f}")
+        logger.debug("[Stripe] Refunding %s $%.2f", transaction_id, amount)
         return {
             "refund_id": f"ref_{transaction_id}",
             "status": "succeeded",
@@ -67,6 +83,8 @@ class FakeOrderRepository:
 
     def __init__(self) -> None:
         self._orders: dict[str, Order] = {}
+        # Orders per customer, keyed by order ID to keep insertion order on re-save
+        self._by_customer: dict[str, dict[str, Order]] = {}
         self._next_id = 1
 
     async def get(self, order_id: str) -> Order | None:
@@ -83,20 +101,31 @@ class FakeOrderRepository:
                 created_at=order.created_at,
             )
             self._next_id += 1
-        self._orders[order.id] = order
+        self._store(order)
         return order
 
     async def find_by_customer(self, customer_id: str) -> list[Order]:
-        return [o for o in self._orders.values() if o.customer_id == customer_id]
+        return list(self._by_customer.get(customer_id, {}).values())
+
+    async def count_by_customer(self, customer_id: str) -> int:
+        return len(self._by_customer.get(customer_id, ()))
+
+    def _store(self, order: Order) -> None:
+        previous = self._orders.get(order.id)
+        if previous is not None and previous.customer_id != order.customer_id:
+            del self._by_customer[previous.customer_id][order.id]
+        self._orders[order.id] = order
+        self._by_customer.setdefault(order.customer_id, {})[order.id] = order
 
     def seed(self, *orders: Order) -> None:
         """Seed with test data."""
         for order in orders:
-            self._orders[order.id] = order
+            self._store(order)
 
     def clear(self) -> None:
         """Clear all orders."""
         self._orders.clear()
+        self._by_customer.clear()
         self._next_id = 1
 
 
@@ -5,6 +5,8 @@ instead of Module classes with Binder configuration.
 """
 
 import asyncio
+import logging
+import sys
 
 from dioxide import Container, Profile
 
@@ -31,8 +33,8 @@ async def main() -> None:
     print(f"Fetched order: {fetched}")
 
     print("\nGetting customer orders...")
-    orders = await service.get_customer_orders("cust_123")
-    print(f"Customer has {len(orders)} order(s)")
+    count = await service.count_customer_orders("cust_123")
+    print(f"Customer has {count} order(s)")
 
     print("\nCancelling order...")
     cancelled = await service.cancel_order(order.id)
@@ -40,4 +42,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Show the production adapters' debug output alongside the demo's prints
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logging.getLogger("app").setLevel(logging.DEBUG)
     asyncio.run(main())
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order domain model."""
 
@@ -38,6 +38,10 @@ class OrderRepositoryPort(Protocol):
         """Find all orders for a customer."""
         ...
 
+    async def count_by_customer(self, customer_id: str) -> int:
+        """Count the orders placed by a customer."""
+        ...
+
 
 class NotificationPort(Protocol):
     """Port for notifications."""
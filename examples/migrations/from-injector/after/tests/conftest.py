@@ -7,15 +7,28 @@ Just create a container with Profile.TEST.
 import pytest
 
 import app.adapters as _adapters  # noqa: F401 — register adapters
+from app.ports import NotificationPort, OrderRepositoryPort, PaymentGatewayPort
 from dioxide import Container, Profile
 
 
+@pytest.fixture(scope="session")
+def _test_container() -> Container:
+    """Build the test-profile container once for the whole session.
+
+    Registration and adapter selection happen here a single time; every test
+    then reuses the same container and its singleton fakes.
+    """
+    return Container(profile=Profile.TEST)
+
+
 @pytest.fixture
-def container() -> Container:
-    """Create a fresh container with test profile.
+def container(_test_container: Container) -> Container:
+    """Return the shared test container with every fake reset.
 
     Profile.TEST automatically selects the fake adapters.
-    No module configuration needed.
+    No module configuration needed. Clearing the fakes gives each test
+    the same clean state a fresh container would.
     """
-    c = Container(profile=Profile.TEST)
-    return c
+    for port in (OrderRepositoryPort, NotificationPort, PaymentGatewayPort):
+        _test_container.resolve(port).clear()
+    return _test_container
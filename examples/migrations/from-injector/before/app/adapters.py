@@ -1,32 +1,47 @@
 """Adapter implementations for injector example."""
 
+import logging
 from datetime import datetime, UTC
 
 from app.ports import NotificationService, Order, OrderRepository, PaymentGateway
 
+logger = logging.getLogger(__name__)
+
 
 class PostgresOrderRepository(OrderRepository):
     """PostgreSQL implementation of OrderRepository."""
 
     def __init__(self) -> None:
         self._orders: dict[str, Order] = {}
+        # Orders per customer, keyed by order ID to keep insertion order on re-save
+        self._by_customer: dict[str, dict[str, Order]] = {}
 
     async def get(self, order_id: str) -> Order | None:
         return self._orders.get(order_id)
 
     async def save(self, order: Order) -> Order:
-        self._orders[order.id] = order
+        self._store(order)
         return order
 
     async def find_by_customer(self, customer_id: str) -> list[Order]:
-        return [o for o in self._orders.values() if o.customer_id == customer_id]
+        return list(self._by_customer.get(customer_id, {}).values())
+
+    async def count_by_customer(self, customer_id: str) -> int:
+        return len(self._by_customer.get(customer_id, ()))
+
+    def _store(self, order: Order) -> None:
+        previous = self._orders.get(order.id)
+        if previous is not None and previous.customer_id != order.customer_id:
+            del self._by_customer[previous.customer_id][order.id]
+        self._orders[order.id] = order
+        self._by_customer.setdefault(order.customer_id, {})[order.id] = order
 
 
 class EmailNotificationService(NotificationService):
     """Email-based notification service."""
 
     async def send(self, recipient: str, message: str) -> bool:
-        print(f"[Email] Sending to {recipient}: {message}")
+        logger.debug("[Email] Sending to %s: %s", recipient, message)
         return True
 
 
@@ -34,7 +49,7 @@ class StripePaymentGateway(PaymentGateway):
     """Stripe implementation of PaymentGateway."""
 
     async def charge(self, customer_id: str, amount: float) -> dict:
-        print(f"[Stripe] Charging {customer_id} ${amount:.2f}")
+        logger.debug("[Stripe] Charging %s $%.2f", customer_id, amount)
         return {
             "transaction_id": f"txn_{customer_id}_{int(amount * 100)}",
             "status": "succeeded",
@@ -42,7 +57,7 @@ class StripePaymentGateway(PaymentGateway):
         }
 
     async def refund(self, transaction_id: str, amount: float) -> dict:
-        print(f"[Stripe] Refunding {transaction_id} ${amount:.2f}")
+        logger.debug("[Stripe] Refunding %s $%.2f", transaction_id, amount)
         return {
             "refund_id": f"ref_{transaction_id}",
             "status": "succeeded",
@@ -55,6 +70,8 @@ class FakeOrderRepository(OrderRepository):
 
     def __init__(self) -> None:
         self._orders: dict[str, Order] = {}
+        # Orders per customer, keyed by order ID to keep insertion order on re-save
+        self._by_customer: dict[str, dict[str, Order]] = {}
         self._next_id = 1
 
     async def get(self, order_id: str) -> Order | None:
@@ -71,16 +88,26 @@ class FakeOrderRepository(OrderRepository):
                 created_at=order.created_at,
             )
             self._next_id += 1
-        self._orders[order.id] = order
+        self._store(order)
         return order
 
     async def find_by_customer(self, customer_id: str) -> list[Order]:
-        return [o for o in self._orders.values() if o.customer_id == customer_id]
+        return list(self._by_customer.get(customer_id, {}).values())
+
+    async def count_by_customer(self, customer_id: str) -> int:
+        return len(self._by_customer.get(customer_id, ()))
+
+    def _store(self, order: Order) -> None:
+        previous = self._orders.get(order.id)
+        if previous is not None and previous.customer_id != order.customer_id:
+            del self._by_customer[previous.customer_id][order.id]
+        self._orders[order.id] = order
+        self._by_customer.setdefault(order.customer_id, {})[order.id] = order
 
     def seed(self, *orders: Order) -> None:
         """Seed with test data."""
         for order in orders:
-            self._orders[order.id] = order
+            self._store(order)
 
 
 class FakeNotificationService(NotificationService):
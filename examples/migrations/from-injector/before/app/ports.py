@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order domain model."""
 
@@ -38,6 +38,11 @@ class OrderRepository(ABC):
         """Find all orders for a customer."""
         pass
 
+    @abstractmethod
+    async def count_by_customer(self, customer_id: str) -> int:
+        """Count the orders placed by a customer."""
+        pass
+
 
 class NotificationService(ABC):
     """Abstract base class for notifications."""
@@ -33,10 +33,10 @@ class OrderService:
         total: float,
     ) -> Order:
         """Create a new order and process payment."""
-        payment_result = await self._payments.charge(customer_id, total)
+        await self._payments.charge(customer_id, total)
 
         order = Order(
-            id=str(uuid4()),
+            id=uuid4().hex,
             customer_id=customer_id,
             items=items,
             total=total,
@@ -60,6 +60,10 @@ class OrderService:
         """Get all orders for a customer."""
         return await self._repository.find_by_customer(customer_id)
 
+    async def count_customer_orders(self, customer_id: str) -> int:
+        """Count the orders placed by a customer."""
+        return await self._repository.count_by_customer(customer_id)
+
     async def cancel_order(self, order_id: str) -> Order | None:
         """Cancel an order and process refund."""
         order = await self._repository.get(order_id)
@@ -71,19 +75,12 @@ class OrderService:
 
         await self._payments.refund(f"txn_{order.id}", order.total)
 
-        cancelled_order = Order(
-            id=order.id,
-            customer_id=order.customer_id,
-            items=order.items,
-            total=order.total,
-            status="cancelled",
-            created_at=order.created_at,
-        )
-        await self._repository.save(cancelled_order)
+        order.status = "cancelled"
+        order = await self._repository.save(order)
 
         await self._notifications.send(
             recipient=order.customer_id,
             message=f"Order {order.id} has been cancelled. Refund of ${order.total:.2f} initiated.",
         )
 
-        return cancelled_order
+        return order
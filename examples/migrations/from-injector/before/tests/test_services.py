@@ -85,6 +85,19 @@ class DescribeOrderService:
 
             assert result is None
 
+    class DescribeCountCustomerOrders:
+        """Tests for count_customer_orders method."""
+
+        async def it_counts_only_the_customers_orders(self, injector: Injector) -> None:
+            service = injector.get(OrderService)
+
+            await service.create_order(customer_id="cust_a", items=["A"], total=1.0)
+            await service.create_order(customer_id="cust_a", items=["B"], total=2.0)
+            await service.create_order(customer_id="cust_b", items=["C"], total=3.0)
+
+            assert await service.count_customer_orders("cust_a") == 2
+            assert await service.count_customer_orders("cust_none") == 0
+
     class DescribeCancelOrder:
         """Tests for cancel_order method."""
 
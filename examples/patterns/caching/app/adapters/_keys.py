@@ -0,0 +1,17 @@
+"""Cache key helpers shared by the cache adapters."""
+
+import fnmatch
+from collections.abc import Iterable
+
+
+def matching_keys(keys: Iterable[str], pattern: str) -> list[str]:
+    """Return the keys matching a glob pattern.
+
+    Plain ``prefix*`` patterns, the usual shape of an invalidation pattern,
+    are matched with str.startswith; anything else goes through fnmatch with
+    the pattern compiled once for the whole scan.
+    """
+    prefix = pattern[:-1]
+    if pattern.endswith("*") and not any(c in prefix for c in "*?["):
+        return [key for key in keys if key.startswith(prefix)]
+    return fnmatch.filter(keys, pattern)
@@ -9,6 +9,14 @@ from dioxide import Profile, adapter
 from ..domain.models import User
 from ..domain.ports import CachePort, DatabaseUserRepositoryPort, UserRepositoryPort
 
+# Cached in place of a user that does not exist, so repeated lookups for a
+# missing ID or email are answered by the cache instead of the database.
+# Compared by value, since a real cache returns a deserialized copy.
+_MISSING_USER = {"__missing__": True}
+
+_USER_KEY_PREFIX = "user:id:"
+_EMAIL_KEY_PREFIX = "user:email:"
+
 
 @adapter.for_(UserRepositoryPort, profile=Profile.PRODUCTION)
 class CachingUserRepository:
@@ -20,8 +28,9 @@ class CachingUserRepository:
     - Adds caching behavior using CachePort
 
     Cache strategy:
-    - Cache individual users by ID and email
-    - Invalidate on write (save/delete)
+    - Cache each user's data once, by ID, plus a small email -> ID pointer
+    - Cache "not found" results too, with a short TTL (negative caching)
+    - Invalidate on save/delete, write through on field updates
     - TTL-based expiration (default 5 minutes)
     """
 
@@ -39,77 +48,114 @@ class CachingUserRepository:
         self.delegate = delegate
         self.cache = cache
         self._ttl = 300  # 5 minutes
+        self._missing_ttl = 30  # Short, so newly created users appear quickly
 
     def _user_key(self, user_id: str) -> str:
         """Generate cache key for user by ID."""
-        return f"user:id:{user_id}"
+        return _USER_KEY_PREFIX + user_id
 
     def _email_key(self, email: str) -> str:
         """Generate cache key for user by email."""
-        return f"user:email:{email}"
+        return _EMAIL_KEY_PREFIX + email
 
     async def get_by_id(self, user_id: str) -> User | None:
         """Get user by ID with cache-aside pattern.
 
         1. Check cache for user
         2. If miss, fetch from database
-        3. If found, cache for future requests
+        3. Cache the result for future requests (briefly, if not found)
         """
         # Check cache first
         key = self._user_key(user_id)
         cached = await self.cache.get(key)
         if cached is not None:
-            return User.from_dict(cached)
+            return None if cached == _MISSING_USER else User.from_dict(cached)
 
         # Cache miss - fetch from database
         user = await self.delegate.get_by_id(user_id)
 
-        # Cache the result (even None results could be cached with short TTL)
-        if user is not None:
-            await self.cache.set(key, user.to_dict(), self._ttl)
-            await self.cache.set(self._email_key(user.email), user.to_dict(), self._ttl)
+        # Cache the result for future requests
+        if user is None:
+            await self.cache.set(key, _MISSING_USER, self._missing_ttl)
+        else:
+            await self._cache_user(user)
 
         return user
 
     async def get_by_email(self, email: str) -> User | None:
-        """Get user by email with caching."""
+        """Get user by email with caching.
+
+        The email key only holds a pointer to the user's ID, so a hit
+        follows it to the entry cached under the ID key.
+        """
         key = self._email_key(email)
         cached = await self.cache.get(key)
+        if cached == _MISSING_USER:
+            return None
         if cached is not None:
-            return User.from_dict(cached)
+            data = await self.cache.get(self._user_key(cached["ref"]))
+            # The ID entry may have been invalidated, or may belong to a
+            # user whose email has since changed; both fall through.
+            if data is not None and data != _MISSING_USER and data["email"] == email:
+                return User.from_dict(data)
 
         user = await self.delegate.get_by_email(email)
 
-        if user is not None:
-            await self.cache.set(key, user.to_dict(), self._ttl)
-            await self.cache.set(self._user_key(user.id), user.to_dict(), self._ttl)
+        if user is None:
+            await self.cache.set(key, _MISSING_USER, self._missing_ttl)
+        else:
+            await self._cache_user(user)
 
         return user
 
+    async def _cache_user(self, user: User) -> None:
+        """Cache the user's data under its ID key and a pointer under its email key."""
+        await self.cache.mset(
+            {
+                self._user_key(user.id): user.to_dict(),
+                self._email_key(user.email): {"ref": user.id},
+            },
+            self._ttl,
+        )
+
     async def save(self, user: User) -> None:
         """Save user and invalidate cache.
 
         Write-through with cache invalidation:
         1. Save to database
-        2. Invalidate cached entries
+        2. Invalidate cached entries (including cached "not found" markers)
         """
         await self.delegate.save(user)
 
         # Invalidate cache (could also update cache here for write-through)
-        await self.cache.delete(self._user_key(user.id))
-        await self.cache.delete(self._email_key(user.email))
+        await self.cache.mdelete([self._user_key(user.id), self._email_key(user.email)])
+
+    async def update_fields(
+        self, user_id: str, name: str | None = None, email: str | None = None
+    ) -> User | None:
+        """Update user fields and write the result through to the cache.
+
+        Unlike save(), the fresh entries replace the cached ones instead of
+        being deleted, so the next read is still a cache hit. A pointer left
+        under a previous email is ignored by get_by_email.
+        """
+        user = await self.delegate.update_fields(user_id, name=name, email=email)
+        if user is not None:
+            await self._cache_user(user)
+        return user
 
     async def delete(self, user_id: str) -> None:
         """Delete user and invalidate cache."""
-        # Get user first to know email for cache invalidation
-        user = await self.delegate.get_by_id(user_id)
-
-        await self.delegate.delete(user_id)
+        # The delegate returns the deleted user, whose email names the other key
+        user = await self.delegate.delete(user_id)
 
         # Invalidate cache
-        await self.cache.delete(self._user_key(user_id))
         if user:
-            await self.cache.delete(self._email_key(user.email))
+            await self.cache.mdelete(
+                [self._user_key(user_id), self._email_key(user.email)]
+            )
+        else:
+            await self.cache.delete(self._user_key(user_id))
 
     async def list_all(self) -> list[User]:
         """List all users (no caching for list operations).
@@ -4,13 +4,13 @@ In tests, we use simple fakes without caching complexity.
 This demonstrates profile-based switching.
 """
 
-import fnmatch
 from typing import Any
 
 from dioxide import Profile, adapter
 
 from ..domain.models import User
 from ..domain.ports import CachePort, UserRepositoryPort
+from ._keys import matching_keys
 
 
 @adapter.for_(UserRepositoryPort, profile=Profile.TEST)
@@ -24,7 +24,15 @@ class FakeUserRepository:
     def __init__(self) -> None:
         """Initialize with empty storage."""
         self.users: dict[str, User] = {}
-        self._email_index: dict[str, str] = {}
+        self._by_email: dict[str, User] = {}
+
+    def _store(self, user: User) -> None:
+        """Store a user, dropping the email entry left by a replaced user."""
+        previous = self.users.get(user.id)
+        if previous is not None and previous.email != user.email:
+            self._by_email.pop(previous.email, None)
+        self.users[user.id] = user
+        self._by_email[user.email] = user
 
     async def get_by_id(self, user_id: str) -> User | None:
         """Get user from in-memory storage."""
@@ -32,23 +40,34 @@ class FakeUserRepository:
 
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email from in-memory storage."""
-        user_id = self._email_index.get(email)
-        if user_id:
-            return self.users.get(user_id)
-        return None
+        user = self._by_email.get(email)
+        # A user whose email was changed in place still sits under the old one
+        return user if user is not None and user.email == email else None
 
     async def save(self, user: User) -> None:
         """Save user to in-memory storage."""
-        self.users[user.id] = user
-        self._email_index[user.email] = user.id
+        self._store(user)
+
+    async def update_fields(
+        self, user_id: str, name: str | None = None, email: str | None = None
+    ) -> User | None:
+        """Update user fields in in-memory storage."""
+        user = self.users.get(user_id)
+        if user is None:
+            return None
+        if name is not None:
+            user.name = name
+        if email is not None and email != user.email:
+            self._by_email.pop(user.email, None)
+            user.email = email
+            self._by_email[email] = user
+        return user
 
     async def delete(self, user_id: str) -> None:
         """Delete user from in-memory storage."""
-        user = self.users.get(user_id)
-        if user:
-            del self.users[user_id]
-            if user.email in self._email_index:
-                del self._email_index[user.email]
+        user = self.users.pop(user_id, None)
+        if user is not None:
+            self._by_email.pop(user.email, None)
 
     async def list_all(self) -> list[User]:
         """List all users from in-memory storage."""
@@ -58,13 +77,12 @@ class FakeUserRepository:
     def seed(self, *users: User) -> None:
         """Seed repository with test data."""
         for user in users:
-            self.users[user.id] = user
-            self._email_index[user.email] = user.id
+            self._store(user)
 
     def clear(self) -> None:
         """Clear all users."""
         self.users.clear()
-        self._email_index.clear()
+        self._by_email.clear()
 
 
 @adapter.for_(CachePort, profile=Profile.TEST)
@@ -104,11 +122,25 @@ class FakeCache:
 
     async def delete_pattern(self, pattern: str) -> None:
         """Delete matching keys."""
-        keys_to_delete = [k for k in self.data.keys() if fnmatch.fnmatch(k, pattern)]
+        keys_to_delete = matching_keys(self.data, pattern)
         for key in keys_to_delete:
             del self.data[key]
             self.delete_count += 1
 
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        """Get several values and track a hit or miss per key."""
+        return [await self.get(key) for key in keys]
+
+    async def mset(self, items: dict[str, Any], ttl_seconds: int = 300) -> None:
+        """Set several values and track one operation per key."""
+        self.data.update(items)
+        self.set_count += len(items)
+
+    async def mdelete(self, keys: list[str]) -> None:
+        """Delete several values and track one operation per deleted key."""
+        for key in keys:
+            await self.delete(key)
+
     # Test helpers
     def clear(self) -> None:
         """Clear cache and reset counters."""
@@ -1,5 +1,6 @@
 """PostgreSQL adapter for direct database access."""
 
+import logging
 from datetime import datetime
 
 from dioxide import Profile, adapter
@@ -7,6 +8,8 @@ from dioxide import Profile, adapter
 from ..domain.models import User
 from ..domain.ports import DatabaseUserRepositoryPort
 
+logger = logging.getLogger(__name__)
+
 
 @adapter.for_(DatabaseUserRepositoryPort, profile=Profile.PRODUCTION)
 class PostgresUserRepository:
@@ -18,47 +21,67 @@ class PostgresUserRepository:
 
     def __init__(self) -> None:
         """Initialize with sample data."""
-        self._users: dict[str, User] = {
-            "user-1": User(id="user-1", name="Alice", email="alice@example.com", created_at=datetime.now()),
-            "user-2": User(id="user-2", name="Bob", email="bob@example.com", created_at=datetime.now()),
-        }
-        self._email_index: dict[str, str] = {
-            "alice@example.com": "user-1",
-            "bob@example.com": "user-2",
-        }
-        print("  [Postgres] Repository initialized with sample data")
+        self._users: dict[str, User] = {}
+        self._by_email: dict[str, User] = {}
+        for user in (
+            User(id="user-1", name="Alice", email="alice@example.com", created_at=datetime.now()),
+            User(id="user-2", name="Bob", email="bob@example.com", created_at=datetime.now()),
+        ):
+            self._store(user)
+        logger.debug("  [Postgres] Repository initialized with sample data")
+
+    def _store(self, user: User) -> None:
+        """Store a user, dropping the email entry left by a replaced user."""
+        previous = self._users.get(user.id)
+        if previous is not None and previous.email != user.email:
+            self._by_email.pop(previous.email, None)
+        self._users[user.id] = user
+        self._by_email[user.email] = user
 
     async def get_by_id(self, user_id: str) -> User | None:
         """Get user from PostgreSQL (simulated)."""
-        print(f"  [Postgres] Querying user by ID: {user_id}")
+        logger.debug("  [Postgres] Querying user by ID: %s", user_id)
         return self._users.get(user_id)
 
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email from PostgreSQL (simulated)."""
-        print(f"  [Postgres] Querying user by email: {email}")
-        user_id = self._email_index.get(email)
-        if user_id:
-            return self._users.get(user_id)
-        return None
+        logger.debug("  [Postgres] Querying user by email: %s", email)
+        user = self._by_email.get(email)
+        # A user whose email was changed in place still sits under the old one
+        return user if user is not None and user.email == email else None
 
     async def save(self, user: User) -> None:
         """Save user to PostgreSQL (simulated)."""
-        print(f"  [Postgres] Saving user: {user.id}")
+        logger.debug("  [Postgres] Saving user: %s", user.id)
         if user.created_at is None:
             user.created_at = datetime.now()
-        self._users[user.id] = user
-        self._email_index[user.email] = user.id
+        self._store(user)
 
-    async def delete(self, user_id: str) -> None:
-        """Delete user from PostgreSQL (simulated)."""
-        print(f"  [Postgres] Deleting user: {user_id}")
+    async def update_fields(
+        self, user_id: str, name: str | None = None, email: str | None = None
+    ) -> User | None:
+        """Update user fields in PostgreSQL (simulated)."""
+        logger.debug("  [Postgres] Updating user: %s", user_id)
         user = self._users.get(user_id)
-        if user:
-            del self._users[user_id]
-            if user.email in self._email_index:
-                del self._email_index[user.email]
+        if user is None:
+            return None
+        if name is not None:
+            user.name = name
+        if email is not None and email != user.email:
+            self._by_email.pop(user.email, None)
+            user.email = email
+            self._by_email[email] = user
+        return user
+
+    async def delete(self, user_id: str) -> User | None:
+        """Delete user from PostgreSQL (simulated), returning the deleted row."""
+        logger.debug("  [Postgres] Deleting user: %s", user_id)
+        user = self._users.pop(user_id, None)
+        if user is not None:
+            self._by_email.pop(user.email, None)
+        return user
 
     async def list_all(self) -> list[User]:
         """List all users from PostgreSQL (simulated)."""
-        print(f"  [Postgres] Listing all users (count: {len(self._users)})")
+        logger.debug("  [Postgres] Listing all users (count: %d)", len(self._users))
         return list(self._users.values())
@@ -1,11 +1,14 @@
 """Redis adapter for caching."""
 
-import fnmatch
+import logging
 from typing import Any
 
 from dioxide import Profile, adapter
 
 from ..domain.ports import CachePort
+from ._keys import matching_keys
+
+logger = logging.getLogger(__name__)
 
 
 @adapter.for_(CachePort, profile=Profile.PRODUCTION)
@@ -18,31 +21,62 @@ class RedisCache:
     def __init__(self) -> None:
         """Initialize simulated Redis."""
         self._cache: dict[str, Any] = {}
-        print("  [Redis] Cache initialized")
+        logger.debug("  [Redis] Cache initialized")
 
     async def get(self, key: str) -> Any | None:
         """Get value from Redis (simulated)."""
         value = self._cache.get(key)
         if value is not None:
-            print(f"  [Redis] Cache HIT: {key}")
+            logger.debug("  [Redis] Cache HIT: %s", key)
         else:
-            print(f"  [Redis] Cache MISS: {key}")
+            logger.debug("  [Redis] Cache MISS: %s", key)
         return value
 
     async def set(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
         """Set value in Redis with TTL (simulated)."""
         self._cache[key] = value
-        print(f"  [Redis] Cache SET: {key} (TTL={ttl_seconds}s)")
+        logger.debug("  [Redis] Cache SET: %s (TTL=%ss)", key, ttl_seconds)
 
     async def delete(self, key: str) -> None:
         """Delete value from Redis (simulated)."""
         if key in self._cache:
             del self._cache[key]
-            print(f"  [Redis] Cache DELETE: {key}")
+            logger.debug("  [Redis] Cache DELETE: %s", key)
 
     async def delete_pattern(self, pattern: str) -> None:
-        """Delete all keys matching pattern (simulated SCAN + DEL)."""
-        keys_to_delete = [k for k in self._cache.keys() if fnmatch.fnmatch(k, pattern)]
+        """Delete all keys matching pattern (simulated SCAN MATCH + UNLINK)."""
+        keys_to_delete = matching_keys(self._cache, pattern)
         for key in keys_to_delete:
             del self._cache[key]
-        print(f"  [Redis] Cache DELETE pattern {pattern}: {len(keys_to_delete)} keys")
+        logger.debug(
+            "  [Redis] Cache DELETE pattern %s: %d keys", pattern, len(keys_to_delete)
+        )
+
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        """Get several values with a single MGET (simulated)."""
+        values = [self._cache.get(key) for key in keys]
+        if logger.isEnabledFor(logging.DEBUG):
+            hits = sum(value is not None for value in values)
+            logger.debug(
+                "  [Redis] Cache MGET: %s (%d/%d hits)",
+                ", ".join(keys),
+                hits,
+                len(keys),
+            )
+        return values
+
+    async def mset(self, items: dict[str, Any], ttl_seconds: int = 300) -> None:
+        """Set several values in one pipelined round-trip (simulated)."""
+        self._cache.update(items)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "  [Redis] Cache SET: %s (TTL=%ss)", ", ".join(items), ttl_seconds
+            )
+
+    async def mdelete(self, keys: list[str]) -> None:
+        """Delete several values with a single DEL (simulated)."""
+        deleted = [key for key in keys if key in self._cache]
+        for key in deleted:
+            del self._cache[key]
+        if deleted and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  [Redis] Cache DELETE: %s", ", ".join(deleted))
@@ -31,6 +31,12 @@ class UserRepositoryPort(Protocol):
         """Save a user (create or update)."""
         ...
 
+    async def update_fields(
+        self, user_id: str, name: str | None = None, email: str | None = None
+    ) -> User | None:
+        """Update the given fields of a stored user and return it (None if missing)."""
+        ...
+
     async def delete(self, user_id: str) -> None:
         """Delete a user by ID."""
         ...
@@ -64,8 +70,14 @@ class DatabaseUserRepositoryPort(Protocol):
         """Save a user to database."""
         ...
 
-    async def delete(self, user_id: str) -> None:
-        """Delete a user from database."""
+    async def update_fields(
+        self, user_id: str, name: str | None = None, email: str | None = None
+    ) -> User | None:
+        """Update the given fields of a user in database (None if missing)."""
+        ...
+
+    async def delete(self, user_id: str) -> User | None:
+        """Delete a user from database, returning the deleted user (None if missing)."""
         ...
 
     async def list_all(self) -> list[User]:
@@ -91,3 +103,15 @@ class CachePort(Protocol):
     async def delete_pattern(self, pattern: str) -> None:
         """Delete all keys matching pattern."""
         ...
+
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        """Get several values from cache in one round-trip."""
+        ...
+
+    async def mset(self, items: dict[str, Any], ttl_seconds: int = 300) -> None:
+        """Set several values in cache with the same TTL in one round-trip."""
+        ...
+
+    async def mdelete(self, keys: list[str]) -> None:
+        """Delete several values from cache in one round-trip."""
+        ...
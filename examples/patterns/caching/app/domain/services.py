@@ -35,17 +35,7 @@ class UserService:
 
     async def update_user(self, user_id: str, name: str | None = None, email: str | None = None) -> User | None:
         """Update an existing user."""
-        user = await self.repository.get_by_id(user_id)
-        if user is None:
-            return None
-
-        if name is not None:
-            user.name = name
-        if email is not None:
-            user.email = email
-
-        await self.repository.save(user)
-        return user
+        return await self.repository.update_fields(user_id, name=name, email=email)
 
     async def delete_user(self, user_id: str) -> bool:
         """Delete a user."""
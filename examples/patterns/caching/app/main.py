@@ -5,6 +5,8 @@ with transparent caching using Redis.
 """
 
 import asyncio
+import logging
+import sys
 
 from dioxide import Container, Profile
 
@@ -72,7 +74,7 @@ async def main() -> None:
 
     print()
     print("-" * 70)
-    print("Update user: Invalidates cache")
+    print("Update user: Writes through to cache")
     print("-" * 70)
     print()
 
@@ -82,7 +84,7 @@ async def main() -> None:
 
     print()
     print("-" * 70)
-    print("Read updated user: Cache MISS (was invalidated)")
+    print("Read updated user: Cache HIT (written through)")
     print("-" * 70)
     print()
 
@@ -95,10 +97,12 @@ async def main() -> None:
     print("Key Takeaways:")
     print("1. Caching is transparent to UserService")
     print("2. Cache hits avoid database queries")
-    print("3. Writes invalidate cache entries")
+    print("3. Writes refresh or invalidate cache entries")
     print("4. Profile.TEST would use FakeUserRepository (no caching)")
     print("=" * 70)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logging.getLogger("app").setLevel(logging.DEBUG)
     asyncio.run(main())
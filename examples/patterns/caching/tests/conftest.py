@@ -8,11 +8,22 @@ from app.domain import User, UserRepositoryPort
 from app.domain.ports import CachePort
 
 
+@pytest.fixture(scope="session")
+def _test_container() -> Container:
+    """Build the test-profile container once for the whole session.
+
+    Registration and adapter selection happen here a single time; every test
+    then reuses the same container and its singleton fakes.
+    """
+    return Container(profile=Profile.TEST)
+
+
 @pytest.fixture
-def container() -> Container:
-    """Create test container."""
-    c = Container(profile=Profile.TEST)
-    return c
+def container(_test_container: Container) -> Container:
+    """Return the shared test container with the fakes reset."""
+    _test_container.resolve(UserRepositoryPort).clear()
+    _test_container.resolve(CachePort).clear()
+    return _test_container
 
 
 @pytest.fixture
@@ -9,6 +9,9 @@ These tests use Profile.TEST which provides FakeUserRepository
 
 from dioxide import Container
 
+from app.adapters.caching import CachingUserRepository
+from app.adapters.fakes import FakeCache, FakeUserRepository
+from app.adapters.postgres import PostgresUserRepository
 from app.domain import User, UserService
 from app.domain.ports import CachePort, UserRepositoryPort
 
@@ -124,6 +127,24 @@ class DescribeFakeRepository:
         user = await repository.get_by_id("test-1")
         assert user is None
 
+    async def it_forgets_the_old_email_when_a_user_changes_it(
+        self,
+        container: Container,
+    ) -> None:
+        """Email lookups only find a user under their current email."""
+        repository = container.resolve(UserRepositoryPort)
+        repository.seed(User(id="u1", name="Alice", email="old@example.com"))
+
+        await repository.save(User(id="u1", name="Alice", email="new@example.com"))
+        user = await repository.get_by_id("u1")
+        assert user is not None
+        user.email = "newer@example.com"
+        await repository.save(user)
+
+        assert await repository.get_by_email("old@example.com") is None
+        assert await repository.get_by_email("new@example.com") is None
+        assert await repository.get_by_email("newer@example.com") is user
+
 
 class DescribeFakeCache:
     """Tests demonstrating fake cache behavior."""
@@ -158,6 +179,108 @@ class DescribeFakeCache:
         assert not cache.was_cached("user:2")
         assert cache.was_cached("product:1")
 
+    async def it_supports_glob_patterns_beyond_prefixes(
+        self,
+        container: Container,
+        cache: CachePort,
+    ) -> None:
+        """Patterns with wildcards before the end still match like fnmatch."""
+        await cache.set("user:id:1", {"id": "1"})
+        await cache.set("user:email:a@example.com", {"id": "1"})
+
+        await cache.delete_pattern("user:*:1")
+
+        assert not cache.was_cached("user:id:1")
+        assert cache.was_cached("user:email:a@example.com")
+
+    async def it_supports_batch_operations(
+        self,
+        container: Container,
+        cache: CachePort,
+    ) -> None:
+        """FakeCache batch operations track each key like single-key calls."""
+        await cache.mset({"user:1": {"id": "1"}, "user:2": {"id": "2"}})
+
+        values = await cache.mget(["user:1", "user:3"])
+        await cache.mdelete(["user:1", "user:2", "user:3"])
+
+        assert values == [{"id": "1"}, None]
+        assert cache.set_count == 2
+        assert cache.hit_count == 1
+        assert cache.miss_count == 1
+        assert cache.delete_count == 2
+        assert not cache.was_cached("user:2")
+
+
+class DescribeCachingUserRepository:
+    """Tests for the caching wrapper, built directly around the fakes."""
+
+    async def it_caches_missing_users_until_they_are_saved(self) -> None:
+        """Repeated lookups for an unknown ID reach the database only once."""
+        database = FakeUserRepository()
+        cache = FakeCache()
+        repository = CachingUserRepository(delegate=database, cache=cache)
+
+        assert await repository.get_by_id("ghost") is None
+        database.seed(User(id="ghost", name="Casper", email="casper@example.com"))
+        assert await repository.get_by_id("ghost") is None
+
+        await repository.save(database.users["ghost"])
+        user = await repository.get_by_id("ghost")
+
+        assert user is not None
+        assert user.name == "Casper"
+
+    async def it_stores_user_data_once_with_an_email_pointer(self) -> None:
+        """Lookups by email follow a pointer to the entry cached by ID."""
+        database = FakeUserRepository()
+        cache = FakeCache()
+        repository = CachingUserRepository(delegate=database, cache=cache)
+        database.seed(User(id="u1", name="Alice", email="alice@example.com"))
+
+        await repository.get_by_id("u1")
+        database.seed(User(id="u1", name="Renamed", email="alice@example.com"))
+        user = await repository.get_by_email("alice@example.com")
+
+        assert cache.data["user:email:alice@example.com"] == {"ref": "u1"}
+        assert cache.data["user:id:u1"]["name"] == "Alice"
+        assert user is not None
+        assert user.name == "Alice"
+
+    async def it_writes_field_updates_through_to_the_cache(self) -> None:
+        """Reads after an update are cache hits that see the new fields."""
+        database = FakeUserRepository()
+        cache = FakeCache()
+        repository = CachingUserRepository(delegate=database, cache=cache)
+        database.seed(User(id="u1", name="Alice", email="alice@example.com"))
+        await repository.get_by_id("u1")
+
+        await repository.update_fields("u1", name="Alicia", email="alicia@example.com")
+        by_id = await repository.get_by_id("u1")
+        by_new_email = await repository.get_by_email("alicia@example.com")
+        by_old_email = await repository.get_by_email("alice@example.com")
+
+        assert by_id is not None
+        assert by_id.name == "Alicia"
+        assert by_new_email is not None
+        assert by_new_email.id == "u1"
+        assert by_old_email is None
+        assert cache.miss_count == 1
+
+    async def it_invalidates_both_keys_from_the_deleted_row(self) -> None:
+        """Deleting uses the row returned by the database to find the email key."""
+        cache = FakeCache()
+        repository = CachingUserRepository(
+            delegate=PostgresUserRepository(), cache=cache
+        )
+        await repository.get_by_id("user-1")
+
+        await repository.delete("user-1")
+
+        assert not cache.was_cached("user:id:user-1")
+        assert not cache.was_cached("user:email:alice@example.com")
+        assert await repository.get_by_email("alice@example.com") is None
+
 
 class DescribeTestIsolation:
     """Tests demonstrating test isolation."""
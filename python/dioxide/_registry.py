@@ -48,11 +48,17 @@ def _clear_registry() -> None:
         affect already-configured Container instances.
     """
     # Import here to avoid circular imports
-    from dioxide.adapter import _adapter_registry  # noqa: PLC0415
+    from dioxide.adapter import (  # noqa: PLC0415
+        _adapter_registry,
+        _adapters_by_name,
+        _adapters_by_port,
+    )
     from dioxide.lifecycle import _lifecycle_registry  # noqa: PLC0415
 
     _component_registry.clear()
     _adapter_registry.clear()
+    _adapters_by_name.clear()
+    _adapters_by_port.clear()
     _lifecycle_registry.clear()
 
 
@@ -159,13 +159,16 @@ See Also:
 
 from __future__ import annotations
 
+import sys
 import warnings
+from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
     TypeVar,
 )
 
+from dioxide._registry import _component_registry
 from dioxide.profile_enum import Profile
 from dioxide.scope import Scope
 
@@ -205,6 +208,26 @@ def _warn_for_string_profile(profile_value: str) -> None:
 # Global registry for adapter-decorated classes
 _adapter_registry: set[type[Any]] = set()
 
+# Adapter classes keyed by the port they implement, in registration order.
+# Port types hash by identity, so scope and implementation lookups on the
+# resolve path are a single dict probe instead of a scan of every adapter.
+_adapters_by_port: dict[type[Any], list[type[Any]]] = {}
+
+# Module-level adapter classes keyed by (module, qualname), together with the
+# module object they were defined in. When a module is imported again (e.g.
+# after being dropped from sys.modules), its fresh class objects replace the
+# stale ones instead of accumulating in the registry. Classes sharing a name
+# within one import (e.g. built with type() in a helper) are all kept.
+_adapters_by_name: dict[tuple[str, str], tuple[ModuleType | None, list[type[Any]]]] = {}
+
+
+def _unregister_adapter(cls: type[Any]) -> None:
+    """Remove an adapter class from the registry and the port index."""
+    _adapter_registry.discard(cls)
+    port_adapters = _adapters_by_port.get(getattr(cls, '__dioxide_port__', None), [])  # type: ignore[arg-type]
+    if cls in port_adapters:
+        port_adapters.remove(cls)
+
 
 class AdapterDecorator:
     """Main decorator class with .for_() method for marking adapters.
@@ -427,10 +450,24 @@ class AdapterDecorator:
             )
             raise TypeError(msg)
 
+        # Normalize profiles once per for_() call rather than per decorated class.
+        # Emit deprecation warnings for non-canonical profile patterns
+        if isinstance(profile, str):
+            # Raw string profile (not Profile instance) is deprecated for known profiles
+            if not isinstance(profile, Profile):
+                _warn_for_string_profile(profile)
+            profiles = frozenset({profile.lower()})
+        else:
+            # List of profiles - check each element
+            normalized: set[str] = set()
+            for p in profile:
+                if isinstance(p, str) and not isinstance(p, Profile):
+                    _warn_for_string_profile(p)
+                normalized.add(p.lower())
+            profiles = frozenset(normalized)
+
         def decorator(cls: type[T]) -> type[T]:
             # Check for stacked @service and @adapter
-            from dioxide._registry import _component_registry  # noqa: PLC0415
-
             if cls in _component_registry:
                 msg = (
                     f'{cls.__name__} has both @service and @adapter.for_() decorators. '
@@ -447,29 +484,35 @@ class AdapterDecorator:
                 )
                 raise TypeError(msg)
 
-            # Emit deprecation warnings for non-canonical profile patterns
-            if isinstance(profile, str):
-                # Raw string profile (not Profile instance) is deprecated for known profiles
-                if not isinstance(profile, Profile):
-                    _warn_for_string_profile(profile)
-                profiles = {profile.lower()}
-            else:
-                # List of profiles - check each element
-                profiles = set()
-                for p in profile:
-                    if isinstance(p, str) and not isinstance(p, Profile):
-                        _warn_for_string_profile(p)
-                    profiles.add(p.lower())
+            # Re-decorating an adapter moves it to its new port in the index
+            if cls in _adapter_registry:
+                _unregister_adapter(cls)
+
+            # A re-imported module re-runs this decorator on a new class object;
+            # drop the stale registrations so they cannot shadow or conflict
+            if '<locals>' not in cls.__qualname__:
+                name = (cls.__module__, cls.__qualname__)
+                module = sys.modules.get(cls.__module__)
+                entry = _adapters_by_name.get(name)
+                if entry is not None and entry[0] is not module:
+                    for stale in entry[1]:
+                        _unregister_adapter(stale)
+                    entry = None
+                if entry is None:
+                    entry = _adapters_by_name[name] = (module, [])
+                if cls not in entry[1]:
+                    entry[1].append(cls)
 
             # Store metadata on class
             cls.__dioxide_port__ = port  # type: ignore[attr-defined]
-            cls.__dioxide_profiles__ = frozenset(profiles)  # type: ignore[attr-defined]
+            cls.__dioxide_profiles__ = profiles  # type: ignore[attr-defined]
             cls.__dioxide_scope__ = scope  # type: ignore[attr-defined]
             cls.__dioxide_multi__ = multi  # type: ignore[attr-defined]
             cls.__dioxide_priority__ = priority  # type: ignore[attr-defined]
 
             # Register with global registry
             _adapter_registry.add(cls)
+            _adapters_by_port.setdefault(port, []).append(cls)
 
             return cls
 
@@ -420,11 +420,17 @@ from __future__ import annotations
 import importlib
 import inspect
 import logging
+import os
 import pkgutil
+import sys
 import time
 import types
 import typing
-from collections.abc import Callable
+import weakref
+from collections.abc import (
+    Callable,
+    Iterable,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -433,6 +439,14 @@ from typing import (
 )
 
 from dioxide._dioxide_core import Container as RustContainer
+from dioxide._registry import (
+    _component_registry,
+    _get_registered_components,
+)
+from dioxide.adapter import (
+    _adapter_registry,
+    _adapters_by_port,
+)
 from dioxide.exceptions import (
     AdapterNotFoundError,
     CaptiveDependencyError,
@@ -450,6 +464,38 @@ if TYPE_CHECKING:
 
 T = TypeVar('T')
 
+# Sentinel for singleton cache misses (a singleton factory may legitimately return None)
+_NOT_CACHED: Any = object()
+
+
+def _call_transient_factory(factory: Callable[[], Any]) -> Any:
+    """Call a FACTORY-scoped provider the way the Rust core would.
+
+    The Rust core reports any exception raised by a provider as a ``KeyError``
+    carrying ``'Python error: <type>: <message>'``; resolve() builds its
+    transitive-failure errors from that, so the direct call keeps the same
+    contract.
+    """
+    try:
+        return factory()
+    except Exception as exc:
+        raise KeyError(f'Python error: {type(exc).__qualname__}: {exc}') from None
+
+
+# Setting this environment variable to a non-empty value other than "0" makes
+# scan() skip checks that only catch configuration mistakes (captive
+# dependencies, orphan @lifecycle classes). Intended for production processes
+# whose wiring has already been validated, e.g. by CI or a health-check boot.
+_SKIP_VALIDATION_ENV_VAR = 'DIOXIDE_SKIP_VALIDATION'
+
+# Submodule names discovered per package, keyed by package name and search path.
+# Repeated scans of the same package reuse the list instead of re-walking the filesystem.
+_package_modules: dict[tuple[str, tuple[str, ...]], tuple[str, ...]] = {}
+
+# Names discovered by lazy AST parsing, keyed by file path and validated against
+# (st_mtime_ns, st_size), so repeated lazy scans skip re-reading unchanged sources.
+_lazy_discovered_names: dict[str, tuple[int, int, tuple[str, ...]]] = {}
+
 # Python builtin types that are NEVER container-managed dependencies.
 # These appear in constructor signatures of pydantic models and config
 # classes but should use their defaults, not be resolved from the container.
@@ -469,6 +515,119 @@ _PRIMITIVE_TYPES: frozenset[type] = frozenset(
 )
 
 
+# Resolved constructor dependencies per class, shared by every container so that
+# signature inspection and type hint evaluation run once per class rather than
+# once per scan. Weak keys let locally-defined classes (common in tests) be freed.
+_constructor_dependencies: weakref.WeakKeyDictionary[type[Any], tuple[tuple[str, Any], ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_constructor_dependencies(cls: type[Any]) -> tuple[tuple[str, Any], ...]:
+    """Return the ``(param_name, type_hint)`` pairs of a class's ``__init__``.
+
+    Only annotated parameters are returned; ``self``, ``*args`` and ``**kwargs``
+    are skipped. Results are cached per class. Failures are not cached, so a
+    forward reference that cannot be resolved yet is retried on the next call.
+
+    Args:
+        cls: The class whose constructor should be inspected.
+
+    Returns:
+        Tuple of parameter names and their resolved type hints, in signature order.
+
+    Raises:
+        ValueError: If the constructor signature cannot be inspected.
+        AttributeError: If the class has no inspectable ``__init__``.
+        NameError: If a type hint refers to a name that cannot be resolved.
+    """
+    cached = _constructor_dependencies.get(cls)
+    if cached is not None:
+        return cached
+
+    init = cls.__init__
+    if type(init) is types.FunctionType and not hasattr(init, '__wrapped__') and not hasattr(init, '__signature__'):
+        # Plain Python function: read parameter names straight from the code
+        # object instead of building an inspect.Signature
+        code = init.__code__
+        parameter_names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+
+        # Annotations that are already plain classes (no string forward references,
+        # no generics or Annotated[...]) need no evaluation, so get_type_hints and
+        # the local-namespace frame walk below can be skipped entirely
+        try:
+            annotations = init.__annotations__
+        except NameError:
+            annotations = None
+        if annotations is not None and all(
+            isinstance(hint, type) and not isinstance(hint, types.GenericAlias)
+            for name, hint in annotations.items()
+            if name != 'return'
+        ):
+            dependencies = tuple(
+                (name, annotations[name]) for name in parameter_names if name != 'self' and name in annotations
+            )
+            _constructor_dependencies[cls] = dependencies
+            return dependencies
+    else:
+        parameter_names = tuple(
+            name
+            for name, param in inspect.signature(init).parameters.items()
+            if param.kind not in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.VAR_POSITIONAL)
+        )
+
+    # Pass both global and local namespaces to resolve forward references.
+    # Include the class's own namespace to handle references to sibling local classes.
+    globalns = getattr(cls.__init__, '__globals__', {})
+    localns = dict(vars(cls))
+    localns[cls.__name__] = cls
+
+    # Local classes (e.g., defined inside test functions) may reference other
+    # local classes; walk the call stack to make those names resolvable.
+    if '<locals>' in cls.__qualname__:
+        try:
+            frame: types.FrameType | None = sys._getframe()
+            while frame is not None:
+                for name, obj in frame.f_locals.items():
+                    if inspect.isclass(obj):
+                        localns[name] = obj
+                frame = frame.f_back
+        except (AttributeError, ValueError):
+            # Frame walking failed - continue without local class resolution
+            pass
+
+    type_hints = get_type_hints(cls.__init__, globalns=globalns, localns=localns)
+
+    dependencies = tuple((name, type_hints[name]) for name in parameter_names if name != 'self' and name in type_hints)
+    _constructor_dependencies[cls] = dependencies
+    return dependencies
+
+
+# Public method names per protocol, shared by every container so that validating
+# register_instance() calls against the same port walks dir(protocol) only once.
+_protocol_method_names: weakref.WeakKeyDictionary[type[Any], tuple[str, ...]] = weakref.WeakKeyDictionary()
+
+
+def _get_protocol_method_names(protocol: type[Any]) -> tuple[str, ...]:
+    """Return the public callable member names of a Protocol, cached per protocol.
+
+    Args:
+        protocol: The Protocol type to inspect.
+
+    Returns:
+        Names of the non-underscore callable attributes visible on the protocol.
+    """
+    cached = _protocol_method_names.get(protocol)
+    if cached is not None:
+        return cached
+
+    names = tuple(
+        name for name in dir(protocol) if not name.startswith('_') and callable(getattr(protocol, name, None))
+    )
+    _protocol_method_names[protocol] = names
+    return names
+
+
 class Container:
     """Dependency injection container.
 
@@ -604,6 +763,10 @@ class Container:
         self._lazy_port_to_modules: dict[str, list[tuple[str, str | Profile | None]]] = {}
         self._probing_deps: set[type[Any]] = set()  # Guards against circular probing
         self._resolving: set[type[Any]] = set()  # Tracks types currently in resolve() stack
+        self._singleton_types: set[type[Any]] = set()  # Types whose provider always yields the same instance
+        self._singleton_cache: dict[type[Any], Any] = {}  # Resolved singletons, checked before the Rust core
+        # FACTORY-scoped providers that resolve() calls directly instead of through the Rust core
+        self._transient_factories: dict[type[Any], Callable[[], Any]] = {}
 
         # Auto-scan if profile is provided
         if profile is not None:
@@ -721,6 +884,7 @@ class Container:
         """
         self._validate_instance_type(component_type, instance)
         self._rust_core.register_instance(component_type, instance)
+        self._singleton_types.add(component_type)
 
     def _validate_instance_type(self, component_type: type[T], instance: T) -> None:
         """Validate that instance is compatible with component_type.
@@ -754,17 +918,8 @@ class Container:
         Returns:
             True if instance implements all methods defined by the protocol.
         """
-        # Get all methods defined by the protocol (excluding dunder methods)
-        protocol_methods = set()
-        for name in dir(protocol):
-            if name.startswith('_'):
-                continue
-            attr = getattr(protocol, name, None)
-            if callable(attr):
-                protocol_methods.add(name)
-
-        # Check if instance has all required methods
-        for method_name in protocol_methods:
+        # Check if instance has all methods defined by the protocol (excluding dunder methods)
+        for method_name in _get_protocol_method_names(protocol):
             if not hasattr(instance, method_name):
                 return False
             if not callable(getattr(instance, method_name)):
@@ -842,6 +997,7 @@ class Container:
             as it provides lazy initialization and instance sharing.
         """
         self._rust_core.register_singleton_factory(component_type, factory)
+        self._singleton_types.add(component_type)
 
     def register_transient_factory(self, component_type: type[T], factory: Callable[[], T]) -> None:
         """Register a transient factory function for a given type.
@@ -882,6 +1038,10 @@ class Container:
             For shared services, use register_singleton_factory() instead.
         """
         self._rust_core.register_transient_factory(component_type, factory)
+        # REQUEST-scoped components also use transient factories but must keep going
+        # through resolve()'s scope check, so only plain transient types get the fast path
+        if isinstance(component_type, type) and self._get_component_scope(component_type) != Scope.REQUEST:
+            self._transient_factories[component_type] = factory
 
     def register_singleton(self, component_type: type[T], factory: Callable[[], T]) -> None:
         """Register a singleton provider manually.
@@ -1008,16 +1168,22 @@ class Container:
             Type annotations in constructors enable automatic dependency
             injection. The container recursively resolves all dependencies.
         """
-        # Check if this is a list[Port] type hint for multi-bindings
-        multi_binding_result = self._resolve_multi_binding(component_type)
-        if multi_binding_result is not None:
-            return multi_binding_result  # type: ignore[return-value]
-
-        # Check if this is a REQUEST-scoped component being resolved outside a scope
-        scope = self._get_component_scope(component_type)
-        if scope is not None:
-            from dioxide.scope import Scope
-
+        # Fast path: singletons that were already resolved skip the Rust round-trip
+        cached = self._singleton_cache.get(component_type, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached  # type: ignore[no-any-return]
+
+        # FACTORY-scoped types are plain classes with a known, non-REQUEST scope, so
+        # they skip the multi-binding and scope checks and the Rust round-trip
+        transient_factory = self._transient_factories.get(component_type)
+        if transient_factory is None:
+            # Check if this is a list[Port] type hint for multi-bindings
+            multi_binding_result = self._resolve_multi_binding(component_type)
+            if multi_binding_result is not None:
+                return multi_binding_result  # type: ignore[return-value]
+
+            # Check if this is a REQUEST-scoped component being resolved outside a scope
+            scope = self._get_component_scope(component_type)
             if scope == Scope.REQUEST:
                 component_name = component_type.__name__
                 raise ScopeError(f'Cannot resolve {component_name}: REQUEST-scoped, requires active scope')
@@ -1030,14 +1196,16 @@ class Container:
         self._resolving.add(component_type)
         try:
             try:
-                return self._rust_core.resolve(component_type)
+                if transient_factory is not None:
+                    return _call_transient_factory(transient_factory)  # type: ignore[no-any-return]
+                return self._cache_singleton(component_type, self._rust_core.resolve(component_type))
             except KeyError as e:
                 # If lazy packages are pending, try per-module lazy import first
                 if self._lazy_port_to_modules:
                     type_name = getattr(component_type, '__name__', '')
                     if self._materialize_lazy_module(type_name):
                         try:
-                            return self._rust_core.resolve(component_type)
+                            return self._cache_singleton(component_type, self._rust_core.resolve(component_type))
                         except KeyError:
                             pass  # Fall through to full materialization
 
@@ -1045,7 +1213,7 @@ class Container:
                 if self._lazy_packages:
                     self._materialize_all_lazy_packages()
                     try:
-                        return self._rust_core.resolve(component_type)
+                        return self._cache_singleton(component_type, self._rust_core.resolve(component_type))
                     except KeyError:
                         pass  # Fall through to error handling below
 
@@ -1070,6 +1238,20 @@ class Container:
         finally:
             self._resolving.discard(component_type)
 
+    def _cache_singleton(self, component_type: type[T], instance: T) -> T:
+        """Remember a resolved instance if its provider is a singleton.
+
+        Args:
+            component_type: The type that was resolved.
+            instance: The instance returned by the Rust core.
+
+        Returns:
+            The instance, unchanged.
+        """
+        if component_type in self._singleton_types:
+            self._singleton_cache[component_type] = instance
+        return instance
+
     def _resolve_multi_binding(self, component_type: Any) -> list[Any] | None:
         """Check if component_type is list[Port] and resolve multi-bindings.
 
@@ -1080,7 +1262,10 @@ class Container:
             List of adapter instances if this is a multi-binding resolution,
             None if not a list[Port] type hint.
         """
-        import typing
+        # Plain classes (services, ports) are never generic aliases; skip the
+        # typing introspection below for them since resolve() calls this every time
+        if isinstance(component_type, type):
+            return None
 
         # Check if this is a generic alias (e.g., list[SomePort])
         origin = typing.get_origin(component_type)
@@ -1148,22 +1333,16 @@ class Container:
         Returns:
             The Scope enum value for this component, or None if not found.
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
-
         # Check if it's a registered component (service)
-        for component_class in _get_registered_components():
-            if component_class is component_type:
-                return getattr(component_class, '__dioxide_scope__', Scope.SINGLETON)
+        if component_type in _component_registry:
+            return getattr(component_type, '__dioxide_scope__', Scope.SINGLETON)
 
         # Check if it's a port - look up the adapter for the port
-        for adapter_class in _adapter_registry:
-            port_class = getattr(adapter_class, '__dioxide_port__', None)
-            if port_class is component_type:
-                # Check if adapter matches active profile
-                adapter_profiles: frozenset[str] = getattr(adapter_class, '__dioxide_profiles__', frozenset())
-                if self._active_profile in adapter_profiles or '*' in adapter_profiles:
-                    return getattr(adapter_class, '__dioxide_scope__', Scope.SINGLETON)
+        for adapter_class in _adapters_by_port.get(component_type, ()):
+            # Check if adapter matches active profile
+            adapter_profiles: frozenset[str] = getattr(adapter_class, '__dioxide_profiles__', frozenset())
+            if self._active_profile in adapter_profiles or '*' in adapter_profiles:
+                return getattr(adapter_class, '__dioxide_scope__', Scope.SINGLETON)
 
         return None
 
@@ -1180,9 +1359,6 @@ class Container:
         Raises:
             CaptiveDependencyError: If a SINGLETON depends on a REQUEST-scoped component.
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.scope import Scope
-
         # Build a map of type -> scope for quick lookup
         type_to_scope: dict[type[Any], Scope] = {}
 
@@ -1221,39 +1397,12 @@ class Container:
 
             # Get constructor dependencies
             try:
-                init_signature = inspect.signature(component_class.__init__)
-                globalns = getattr(component_class.__init__, '__globals__', {})
-                localns = dict(vars(component_class))
-                localns[component_class.__name__] = component_class
-
-                # Handle local classes in tests
-                if '<locals>' in component_class.__qualname__:
-                    try:
-                        import sys
-                        from types import FrameType
-
-                        frame: FrameType | None = sys._getframe()
-                        while frame is not None:
-                            frame_locals = frame.f_locals
-                            for name, obj in frame_locals.items():
-                                if inspect.isclass(obj):
-                                    localns[name] = obj
-                            frame = frame.f_back
-                    except (AttributeError, ValueError):
-                        pass
-
-                type_hints = get_type_hints(component_class.__init__, globalns=globalns, localns=localns)
+                dependencies = _get_constructor_dependencies(component_class)
             except (ValueError, AttributeError, NameError):
                 continue
 
             # Check each dependency
-            for param_name in init_signature.parameters:
-                if param_name == 'self':
-                    continue
-                if param_name not in type_hints:
-                    continue
-
-                dep_type = type_hints[param_name]
+            for _param_name, dep_type in dependencies:
                 dep_scope = type_to_scope.get(dep_type)
 
                 # If dependency is REQUEST-scoped, we have a captive dependency
@@ -1275,8 +1424,6 @@ class Container:
 
         # For ports, check the adapter registry for profile-matching adapters
         if self._is_port(component_type):
-            from dioxide.adapter import _adapter_registry
-
             for adapter_class in _adapter_registry:
                 if getattr(adapter_class, '__dioxide_port__', None) is not component_type:
                     continue
@@ -1289,8 +1436,6 @@ class Container:
                     return True
 
         # For services, check the component registry
-        from dioxide._registry import _get_registered_components
-
         for component_class in _get_registered_components():
             if component_class is not component_type:
                 continue
@@ -1310,9 +1455,6 @@ class Container:
         Probes each dependency to identify the specific one that failed,
         then builds a chain-aware message showing the resolution path.
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
-
         type_name = component_type.__name__
 
         # Find the implementing class for this type
@@ -1461,9 +1603,6 @@ class Container:
         Returns:
             A terse error message with key diagnostic info and guidance.
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
-
         port_name = port_type.__name__
         profile_str = self._active_profile if self._active_profile else 'none'
 
@@ -1523,8 +1662,6 @@ class Container:
         profile_str = self._active_profile if self._active_profile else 'none'
 
         # Check if it's decorated with @service or @component
-        from dioxide._registry import _get_registered_components
-
         registered_components = list(_get_registered_components())
         is_registered = service_type in registered_components
 
@@ -1818,7 +1955,6 @@ class Container:
             - :meth:`is_registered` - Check if a port has an adapter
             - :func:`adapter.for_` - Register adapters for ports
         """
-        from dioxide.adapter import _adapter_registry
         from dioxide.profile_enum import Profile
 
         result: dict[Profile, type[Any]] = {}
@@ -1872,10 +2008,6 @@ class Container:
               DatabasePort:
                 - PostgresAdapter (profiles: production, lifecycle)
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
-        from dioxide.scope import Scope
-
         lines: list[str] = []
         lines.append('=== dioxide Container Debug ===')
 
@@ -1969,9 +2101,6 @@ class Container:
                 +-- SendGridAdapter (profile: production)
                     +-- config: AppConfig
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
-
         lines: list[str] = []
         cls_name = cls.__name__
 
@@ -2010,9 +2139,6 @@ class Container:
             is_last: Whether this is the last sibling.
             visited: Set of already-visited types to detect cycles.
         """
-        from dioxide.adapter import _adapter_registry
-        from dioxide.scope import Scope
-
         cls_name = cls.__name__
 
         # Detect cycles
@@ -2161,10 +2287,6 @@ class Container:
         Returns:
             Tuple of (services, ports, adapters, edges).
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
-        from dioxide.scope import Scope
-
         services: list[tuple[str, str]] = []
         for component_class in _get_registered_components():
             component_profiles: frozenset[str] = getattr(component_class, '__dioxide_profiles__', frozenset())
@@ -2382,15 +2504,28 @@ class Container:
         Detects both @adapter.for_(PortName, ...) and @service decorated classes.
         For adapters, returns the port name. For services, returns the class name.
 
+        Results are cached per file and reused while the file's modification
+        time and size are unchanged.
+
         Returns:
             List of discoverable names (port names for adapters, class names for services).
         """
         import ast
+        import os
+
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return []
+        cached = _lazy_discovered_names.get(filepath)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return list(cached[2])
 
         try:
             with open(filepath) as f:
                 tree = ast.parse(f.read(), filename=filepath)
         except SyntaxError:
+            _lazy_discovered_names[filepath] = (stat.st_mtime_ns, stat.st_size, ())
             return []
 
         names: list[str] = []
@@ -2414,6 +2549,7 @@ class Container:
                 elif isinstance(decorator, ast.Call):
                     if isinstance(decorator.func, ast.Name) and decorator.func.id == 'service':
                         names.append(node.name)
+        _lazy_discovered_names[filepath] = (stat.st_mtime_ns, stat.st_size, tuple(names))
         return names
 
     def _materialize_lazy_module(self, type_name: str) -> bool:
@@ -2485,7 +2621,9 @@ class Container:
 
         Note:
             This is an internal method used by scan() to support package-based
-            scanning. It should not be called directly by users.
+            scanning. It should not be called directly by users. The list of
+            submodules is discovered once per package and reused by later scans,
+            so modules added to the package on disk afterwards are not picked up.
         """
         import logging
 
@@ -2506,13 +2644,27 @@ class Container:
         if not hasattr(package, '__path__'):
             return 1
 
-        # Walk all modules in the package (including sub-packages)
+        # Walk all modules in the package (including sub-packages). The walk hits the
+        # filesystem, so its result is cached and later scans only re-import by name.
+        cache_key = (package.__name__, tuple(package.__path__))
+        cached_modules = _package_modules.get(cache_key)
+        if cached_modules is None:
+            module_names: Iterable[str] = (
+                modname
+                for _importer, modname, _ispkg in pkgutil.walk_packages(
+                    path=package.__path__,
+                    prefix=package.__name__ + '.',
+                    onerror=lambda x: None,  # Silently skip modules that fail to import
+                )
+            )
+        else:
+            module_names = cached_modules
+
         count = 1  # Count the package itself
-        for _importer, modname, _ispkg in pkgutil.walk_packages(
-            path=package.__path__,
-            prefix=package.__name__ + '.',
-            onerror=lambda x: None,  # Silently skip modules that fail to import
-        ):
+        discovered: list[str] = []
+        for modname in module_names:
+            discovered.append(modname)
+
             # Strict mode: analyze source for side effects before importing
             if strict:
                 self._check_module_side_effects(modname)
@@ -2526,6 +2678,9 @@ class Container:
                 # Skip modules that fail to import (missing dependencies, etc.)
                 pass
 
+        if cached_modules is None:
+            _package_modules[cache_key] = tuple(discovered)
+
         return count
 
     def _check_module_side_effects(self, module_name: str) -> None:
@@ -2665,13 +2820,11 @@ class Container:
             - Profile names are case-insensitive (normalized to lowercase)
             - AST-based lazy discovery only detects ``@adapter.for_(PortName)``
               when ``adapter`` is imported directly (not aliased imports).
+            - Set ``DIOXIDE_SKIP_VALIDATION=1`` to skip the captive dependency
+              check and orphan ``@lifecycle`` warnings once the wiring has been
+              validated elsewhere. Ambiguous adapter registrations still raise.
         """
-        from dioxide._registry import (
-            PROFILE_ATTRIBUTE,
-            _get_registered_components,
-        )
-        from dioxide.adapter import _adapter_registry
-        from dioxide.scope import Scope
+        from dioxide._registry import PROFILE_ATTRIBUTE
 
         start_time = time.perf_counter() if stats else None
         adapters_registered_count = 0
@@ -2766,8 +2919,11 @@ class Container:
         # Use single adapters for ambiguity checking downstream
         port_to_adapters = port_to_single_adapters
 
+        validate = os.environ.get(_SKIP_VALIDATION_ENV_VAR, '') in ('', '0')
+
         # Check for captive dependencies (SINGLETON depends on REQUEST)
-        self._check_captive_dependencies(port_to_adapters)
+        if validate:
+            self._check_captive_dependencies(port_to_adapters)
 
         # Register adapters under their port type
         for port_class, adapters in port_to_adapters.items():
@@ -2869,7 +3025,8 @@ class Container:
             )
 
         # Warn about @lifecycle classes not registered with @service or @adapter
-        self._warn_orphan_lifecycle_classes()
+        if validate:
+            self._warn_orphan_lifecycle_classes()
 
         if stats and start_time is not None:
             elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -2886,8 +3043,6 @@ class Container:
         """Warn about @lifecycle classes not registered with @service or @adapter."""
         import warnings
 
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
         from dioxide.lifecycle import _lifecycle_registry
 
         registered = _get_registered_components() | _adapter_registry
@@ -2923,73 +3078,32 @@ class Container:
             - Parameters without type hints are skipped (not passed to __init__)
         """
         try:
-            init_signature = inspect.signature(cls.__init__)
-            # Pass both global and local namespaces to resolve forward references
-            # For local classes (e.g., in tests), we need to pass the class's __dict__ as localns
-            globalns = getattr(cls.__init__, '__globals__', {})
-            # Include the class's own namespace to handle references to sibling local classes
-            localns = dict(vars(cls))
-            # Also include the class itself in case it's referenced
-            localns[cls.__name__] = cls
-
-            # For local classes defined in test functions, we need to get the frame locals
-            # Try to extract locals from the class's qualname
-            if '<locals>' in cls.__qualname__:
-                # This is a local class - try to get its defining scope
-                # We can't reliably get the locals, but we can at least handle the common case
-                # by checking if there are any classes in the same module with the same qualname pattern
-                try:
-                    import sys
-                    from types import FrameType
-
-                    frame: FrameType | None = sys._getframe()
-                    # Walk up the stack to find locals that might contain our dependencies
-                    while frame is not None:
-                        frame_locals = frame.f_locals
-                        # Add any classes from frame locals
-                        for name, obj in frame_locals.items():
-                            if inspect.isclass(obj):
-                                localns[name] = obj
-                        frame = frame.f_back
-                except (AttributeError, ValueError):
-                    # Frame walking failed - continue without local class resolution
-                    pass
-
-            type_hints = get_type_hints(cls.__init__, globalns=globalns, localns=localns)
+            dependencies = _get_constructor_dependencies(cls)
         except (ValueError, AttributeError, NameError):
             # No __init__ or no type hints, or can't resolve type hints - just instantiate directly
             return cls
 
-        # Check if there are any actual dependencies to inject
-        # If there are no type hints (empty dict) or only 'return' hint, just use the class directly
-        injectable_params = [
-            name
-            for name in init_signature.parameters
-            if name != 'self'
-            and name in type_hints
-            and not self._is_non_injectable_type(type_hints[name])
-            and init_signature.parameters[name].kind
-            not in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.VAR_POSITIONAL)
-        ]
-        if not injectable_params:
+        # Only parameters the container can provide are injected; the rest keep their defaults
+        injectable = tuple(
+            (name, dep_type) for name, dep_type in dependencies if not self._is_non_injectable_type(dep_type)
+        )
+        if not injectable:
             # No dependencies to inject - return the class itself for direct instantiation
             return cls
 
-        # Build factory that resolves dependencies
+        # Build factory that resolves dependencies. Singletons that were already
+        # resolved are read straight from the cache (the dict is cleared, never
+        # replaced), so only the remaining dependencies go through resolve().
+        singleton_cache = self._singleton_cache
+
         def factory() -> T:
-            kwargs: dict[str, Any] = {}
-            for param_name in init_signature.parameters:
-                if param_name == 'self':
-                    continue
-                param = init_signature.parameters[param_name]
-                if param.kind in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.VAR_POSITIONAL):
-                    continue
-                if param_name in type_hints:
-                    dependency_type = type_hints[param_name]
-                    if self._is_non_injectable_type(dependency_type):
-                        continue
-                    kwargs[param_name] = self.resolve(dependency_type)
-            return cls(**kwargs)
+            resolve = self.resolve
+            return cls(
+                **{
+                    name: singleton_cache[dep_type] if dep_type in singleton_cache else resolve(dep_type)
+                    for name, dep_type in injectable
+                }
+            )
 
         return factory
 
@@ -2999,16 +3113,11 @@ class Container:
         Returns:
             List of component instances sorted by dependency order (dependencies first).
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
-
         # Collect all lifecycle component classes
         lifecycle_classes: dict[type[Any], Any] = {}
 
         # Check registered components (services)
         # Skip REQUEST-scoped components - they are initialized in scope, not at container start
-        from dioxide.scope import Scope
-
         for component_class in _get_registered_components():
             if hasattr(component_class, '_dioxide_lifecycle'):
                 # Skip REQUEST-scoped components - they're initialized within scopes
@@ -3047,42 +3156,16 @@ class Container:
             deps = set()
             # Check constructor dependencies
             try:
-                init_signature = inspect.signature(component_class.__init__)
-                # Use the same logic as _create_auto_injecting_factory to handle local classes
-                globalns = getattr(component_class.__init__, '__globals__', {})
-                localns = dict(vars(component_class))
-                localns[component_class.__name__] = component_class
-
-                if '<locals>' in component_class.__qualname__:
-                    try:
-                        import sys
-                        from types import FrameType
-
-                        frame: FrameType | None = sys._getframe()
-                        while frame is not None:
-                            frame_locals = frame.f_locals
-                            for name, obj in frame_locals.items():
-                                if inspect.isclass(obj):
-                                    localns[name] = obj
-                            frame = frame.f_back
-                    except (AttributeError, ValueError):
-                        # Frame walking failed - continue without local class resolution
-                        pass
-
-                type_hints = get_type_hints(component_class.__init__, globalns=globalns, localns=localns)
-
-                for param_name in init_signature.parameters:
-                    if param_name == 'self':
-                        continue
-                    if param_name in type_hints:
-                        dep_type = type_hints[param_name]
-                        # Check if dependency is a lifecycle component
-                        if dep_type in lifecycle_classes:
-                            deps.add(lifecycle_classes[dep_type])
-                        elif dep_type in adapter_instances:
-                            deps.add(adapter_instances[dep_type])
+                constructor_dependencies = _get_constructor_dependencies(component_class)
             except (ValueError, AttributeError, NameError):
-                pass
+                constructor_dependencies = ()
+
+            for _param_name, dep_type in constructor_dependencies:
+                # Check if dependency is a lifecycle component
+                if dep_type in lifecycle_classes:
+                    deps.add(lifecycle_classes[dep_type])
+                elif dep_type in adapter_instances:
+                    deps.add(adapter_instances[dep_type])
 
             dependencies[instance] = deps
 
@@ -3095,12 +3178,16 @@ class Container:
         # in_degree[node] = number of dependencies node has (edges pointing TO node)
         from collections import deque
 
+        # dependents[dep] = nodes that depend on dep (reverse edges), so each
+        # edge is visited once: O(V + E) instead of rescanning every node
         in_degree = dict.fromkeys(all_instances, 0)
+        dependents: dict[Any, list[Any]] = {node: [] for node in all_instances}
         for node in all_instances:
             for dep in dependencies.get(node, set()):
                 if dep in in_degree:
                     # node depends on dep, so node has one incoming edge
                     in_degree[node] += 1
+                    dependents[dep].append(node)
 
         queue = deque([node for node in all_instances if in_degree[node] == 0])
         sorted_instances = []
@@ -3109,12 +3196,11 @@ class Container:
             node = queue.popleft()
             sorted_instances.append(node)
 
-            # Find nodes that depend on this node
-            for other_node in all_instances:
-                if node in dependencies.get(other_node, set()):
-                    in_degree[other_node] -= 1
-                    if in_degree[other_node] == 0:
-                        queue.append(other_node)
+            # Release nodes that depend on this node
+            for other_node in dependents[node]:
+                in_degree[other_node] -= 1
+                if in_degree[other_node] == 0:
+                    queue.append(other_node)
 
         # Detect circular dependencies
         if len(sorted_instances) < len(all_instances):
@@ -3305,6 +3391,7 @@ class Container:
             Container: Create fresh instances for complete isolation
         """
         self._rust_core.reset()
+        self._singleton_cache.clear()
         self._lifecycle_instances = None
 
     def create_scope(self) -> ScopedContainerContextManager:
@@ -3513,7 +3600,11 @@ class ScopedContainer:
             ...     # SINGLETON: shared with parent
             ...     config = scope.resolve(AppConfig)
         """
-        from dioxide.scope import Scope
+        # Singletons the parent has already built are served straight from its
+        # cache, so e.g. a per-request Inject(UserService) is a single dict lookup
+        cached = self._parent._singleton_cache.get(component_type, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached  # type: ignore[no-any-return]
 
         # Get the scope for this component type
         scope = self._get_component_scope(component_type)
@@ -3552,19 +3643,14 @@ class ScopedContainer:
         Returns:
             The Scope enum value for this component.
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
-
         # Check if it's a registered component (service)
-        for component_class in _get_registered_components():
-            if component_class is component_type:
-                return getattr(component_class, '__dioxide_scope__', Scope.SINGLETON)
+        if component_type in _component_registry:
+            return getattr(component_type, '__dioxide_scope__', Scope.SINGLETON)
 
         # Check if it's a port - look up the adapter for the port
-        for adapter_class in _adapter_registry:
-            port_class = getattr(adapter_class, '__dioxide_port__', None)
-            if port_class is component_type:
-                return getattr(adapter_class, '__dioxide_scope__', Scope.SINGLETON)
+        adapters = _adapters_by_port.get(component_type)
+        if adapters:
+            return getattr(adapters[0], '__dioxide_scope__', Scope.SINGLETON)
 
         # Default to SINGLETON for unknown types
         return Scope.SINGLETON
@@ -3581,30 +3667,21 @@ class ScopedContainer:
         Returns:
             A new instance with dependencies injected.
         """
-        from dioxide._registry import _get_registered_components
-        from dioxide.adapter import _adapter_registry
-        from dioxide.scope import Scope
-
         # Find the actual implementation class
         impl_class: type[Any] | None = None
 
         # Check if it's a port - find the adapter
-        for adapter_class in _adapter_registry:
-            port_class = getattr(adapter_class, '__dioxide_port__', None)
-            if port_class is component_type:
-                # Check if adapter matches active profile
-                adapter_profiles: frozenset[str] = getattr(adapter_class, '__dioxide_profiles__', frozenset())
-                active_profile = self._parent._active_profile
-                if active_profile in adapter_profiles or '*' in adapter_profiles:
-                    impl_class = adapter_class
-                    break
+        active_profile = self._parent._active_profile
+        for adapter_class in _adapters_by_port.get(component_type, ()):
+            # Check if adapter matches active profile
+            adapter_profiles: frozenset[str] = getattr(adapter_class, '__dioxide_profiles__', frozenset())
+            if active_profile in adapter_profiles or '*' in adapter_profiles:
+                impl_class = adapter_class
+                break
 
         # Check if it's a registered component
-        if impl_class is None:
-            for component_class in _get_registered_components():
-                if component_class is component_type:
-                    impl_class = component_class
-                    break
+        if impl_class is None and component_type in _component_registry:
+            impl_class = component_type
 
         if impl_class is None:
             # Fall back to resolving from parent (might be manually registered)
@@ -3613,47 +3690,22 @@ class ScopedContainer:
 
         # Inspect constructor for dependencies
         try:
-            init_signature = inspect.signature(impl_class.__init__)
-            globalns = getattr(impl_class.__init__, '__globals__', {})
-            localns = dict(vars(impl_class))
-            localns[impl_class.__name__] = impl_class
-
-            # Handle local classes in tests
-            if '<locals>' in impl_class.__qualname__:
-                try:
-                    import sys
-                    from types import FrameType
-
-                    frame: FrameType | None = sys._getframe()
-                    while frame is not None:
-                        frame_locals = frame.f_locals
-                        for name, obj in frame_locals.items():
-                            if inspect.isclass(obj):
-                                localns[name] = obj
-                        frame = frame.f_back
-                except (AttributeError, ValueError):
-                    pass
-
-            type_hints = get_type_hints(impl_class.__init__, globalns=globalns, localns=localns)
+            dependencies = _get_constructor_dependencies(impl_class)
         except (ValueError, AttributeError, NameError):
             # No type hints - instantiate directly
             return impl_class()  # type: ignore[no-any-return]
 
         # Resolve dependencies
         kwargs: dict[str, Any] = {}
-        for param_name in init_signature.parameters:
-            if param_name == 'self':
-                continue
-            if param_name in type_hints:
-                dependency_type = type_hints[param_name]
-                dep_scope = self._get_component_scope(dependency_type)
+        for param_name, dependency_type in dependencies:
+            dep_scope = self._get_component_scope(dependency_type)
 
-                if dep_scope == Scope.SINGLETON:
-                    # SINGLETON deps come from parent
-                    kwargs[param_name] = self._parent.resolve(dependency_type)
-                else:
-                    # REQUEST and FACTORY deps come from this scope
-                    kwargs[param_name] = self.resolve(dependency_type)
+            if dep_scope == Scope.SINGLETON:
+                # SINGLETON deps come from parent
+                kwargs[param_name] = self._parent.resolve(dependency_type)
+            else:
+                # REQUEST and FACTORY deps come from this scope
+                kwargs[param_name] = self.resolve(dependency_type)
 
         return impl_class(**kwargs)  # type: ignore[no-any-return]
 
@@ -3857,5 +3909,8 @@ def reset_global_container() -> None:
     # Replace internal state rather than reassigning the global
     # This ensures code that imported `container` sees the reset state
     container._rust_core = RustContainer()
+    container._singleton_types.clear()
+    container._singleton_cache.clear()
+    container._transient_factories.clear()
     container._active_profile = None
     container._lifecycle_instances = None
@@ -31,6 +31,7 @@ done
 echo "Starting documentation server with live reload..."
 echo "Watching: docs/, python/dioxide/"
 echo "Server: http://localhost:8000"
+echo "API reference: set DIOXIDE_DOCS_FULL=1 to include docs/api/"
 echo ""
 
 uv run sphinx-autobuild docs docs/_build/html \
@@ -0,0 +1,26 @@
+#!/bin/bash
+# Refresh the pinned intersphinx inventories used by the docs build
+#
+# Usage:
+#   ./scripts/update-inventories.sh
+#
+# docs/conf.py reads docs/_inventories/<name>.inv when it exists instead of
+# downloading the inventory on every cold build. Re-run this script (and
+# commit the result) when the upstream docs change enough to matter, e.g.
+# once per Python release.
+
+set -euo pipefail
+
+INVENTORY_DIR="$(dirname "$0")/../docs/_inventories"
+mkdir -p "$INVENTORY_DIR"
+
+fetch() {
+    local name=$1
+    local url=$2
+    echo "Fetching $url"
+    curl --fail --silent --show-error --location --output "$INVENTORY_DIR/$name.inv" "$url"
+}
+
+fetch python-3 https://docs.python.org/3/objects.inv
+
+echo "Inventories written to docs/_inventories/"
@@ -115,3 +115,20 @@ class DescribeAdapterDecorator:
         # Should only have one 'test' after normalization
         assert 'test' in DuplicateAdapter.__dioxide_profiles__
         assert len(DuplicateAdapter.__dioxide_profiles__) == 1
+
+    def it_shares_normalized_profiles_across_classes_using_the_same_decorator(self) -> None:
+        """A single @adapter.for() call normalizes profiles once for every class it decorates."""
+        for_staging = adapter.for_(EmailPort, profile=['Staging', 'QA'])
+
+        @for_staging
+        class FirstAdapter:
+            async def send(self, to: str, subject: str, body: str) -> None:
+                pass
+
+        @for_staging
+        class SecondAdapter:
+            async def send(self, to: str, subject: str, body: str) -> None:
+                pass
+
+        assert FirstAdapter.__dioxide_profiles__ == frozenset({'staging', 'qa'})
+        assert SecondAdapter.__dioxide_profiles__ is FirstAdapter.__dioxide_profiles__
@@ -0,0 +1,159 @@
+"""Tests for the port-keyed adapter index used on the resolve path.
+
+Scope and implementation lookups go straight to the adapters registered for
+a port instead of scanning every adapter in the global registry.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from typing import Protocol
+
+import pytest
+
+from dioxide import (
+    Container,
+    Profile,
+    Scope,
+    adapter,
+)
+from dioxide._registry import _clear_registry
+from dioxide.adapter import (
+    _adapter_registry,
+    _adapters_by_port,
+)
+
+
+class CachePort(Protocol):
+    def get(self, key: str) -> str | None: ...
+
+
+class QueuePort(Protocol):
+    def push(self, item: str) -> None: ...
+
+
+def _make_cache_adapter(profile: Profile, value: str) -> type:
+    """Build a CachePort adapter with type(), so every result is named 'Impl'."""
+    return adapter.for_(CachePort, profile=profile)(type('Impl', (), {'get': lambda self, key: value}))
+
+
+class DescribeAdaptersByPort:
+    """Tests for adapter.py _adapters_by_port."""
+
+    def it_indexes_adapters_under_their_port_in_registration_order(self) -> None:
+        @adapter.for_(CachePort, profile=Profile.PRODUCTION)
+        class RedisCache:
+            def get(self, key: str) -> str | None:
+                return None
+
+        @adapter.for_(CachePort, profile=Profile.TEST)
+        class FakeCache:
+            def get(self, key: str) -> str | None:
+                return None
+
+        assert _adapters_by_port[CachePort] == [RedisCache, FakeCache]
+
+    def it_moves_a_redecorated_adapter_to_its_new_port(self) -> None:
+        @adapter.for_(QueuePort, profile=Profile.TEST)
+        @adapter.for_(CachePort, profile=Profile.TEST)
+        class Hybrid:
+            def get(self, key: str) -> str | None:
+                return None
+
+            def push(self, item: str) -> None:
+                pass
+
+        assert _adapters_by_port[CachePort] == []
+        assert _adapters_by_port[QueuePort] == [Hybrid]
+
+    def it_is_cleared_with_the_registry(self) -> None:
+        @adapter.for_(CachePort, profile=Profile.TEST)
+        class FakeCache:
+            def get(self, key: str) -> str | None:
+                return None
+
+        _clear_registry()
+
+        assert _adapters_by_port == {}
+
+    def it_resolves_the_scope_of_the_adapter_for_the_active_profile(self) -> None:
+        @adapter.for_(CachePort, profile=Profile.PRODUCTION, scope=Scope.REQUEST)
+        class RedisCache:
+            def get(self, key: str) -> str | None:
+                return None
+
+        @adapter.for_(CachePort, profile=Profile.TEST, scope=Scope.FACTORY)
+        class FakeCache:
+            def get(self, key: str) -> str | None:
+                return None
+
+        container = Container(profile=Profile.TEST)
+
+        assert container._get_component_scope(CachePort) == Scope.FACTORY
+
+    def it_binds_structurally_identical_ports_independently(self) -> None:
+        class PrimaryCachePort(Protocol):
+            def get(self, key: str) -> str | None: ...
+
+        class ReplicaCachePort(Protocol):
+            def get(self, key: str) -> str | None: ...
+
+        @adapter.for_(PrimaryCachePort, profile=Profile.TEST)
+        class PrimaryCache:
+            def get(self, key: str) -> str | None:
+                return 'primary'
+
+        @adapter.for_(ReplicaCachePort, profile=Profile.TEST)
+        class ReplicaCache:
+            def get(self, key: str) -> str | None:
+                return 'replica'
+
+        container = Container(profile=Profile.TEST)
+
+        assert isinstance(container.resolve(PrimaryCachePort), PrimaryCache)
+        assert isinstance(container.resolve(ReplicaCachePort), ReplicaCache)
+
+
+class DescribeAdapterReimport:
+    """Tests for re-registration when an adapter module is imported again."""
+
+    def it_replaces_the_stale_class_from_an_earlier_import(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / 'reimport_ports.py').write_text(
+            'from typing import Protocol\n\nclass ClockPort(Protocol):\n    def now(self) -> int: ...\n'
+        )
+        (tmp_path / 'reimport_adapters.py').write_text(
+            'from dioxide import Profile, adapter\n'
+            'from reimport_ports import ClockPort\n\n'
+            '@adapter.for_(ClockPort, profile=Profile.TEST)\n'
+            'class FixedClock:\n'
+            '    def now(self) -> int:\n'
+            '        return 0\n'
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, 'reimport_ports', raising=False)
+        monkeypatch.delitem(sys.modules, 'reimport_adapters', raising=False)
+
+        stale = importlib.import_module('reimport_adapters').FixedClock
+        del sys.modules['reimport_adapters']
+        fresh = importlib.import_module('reimport_adapters').FixedClock
+        port = importlib.import_module('reimport_ports').ClockPort
+
+        container = Container(profile=Profile.TEST)
+
+        assert stale not in _adapter_registry
+        assert _adapters_by_port[port] == [fresh]
+        assert isinstance(container.resolve(port), fresh)
+
+    def it_keeps_same_named_adapters_from_a_single_import(self) -> None:
+        _clear_registry()
+        test_impl = _make_cache_adapter(Profile.TEST, 'test')
+        production_impl = _make_cache_adapter(Profile.PRODUCTION, 'production')
+
+        assert test_impl.__qualname__ == production_impl.__qualname__
+        assert _adapters_by_port[CachePort] == [test_impl, production_impl]
+        assert Container(profile=Profile.TEST).resolve(CachePort).get('k') == 'test'
+        assert Container(profile=Profile.PRODUCTION).resolve(CachePort).get('k') == 'production'
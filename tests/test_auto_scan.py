@@ -33,14 +33,12 @@ from dioxide import (
     adapter,
     service,
 )
-from dioxide.adapter import _adapter_registry
 
 
 @pytest.fixture(autouse=True)
 def clean_registry() -> None:
     """Clear registries before each test to ensure isolation."""
     _clear_registry()
-    _adapter_registry.clear()
 
 
 class DescribeAutoScan:
@@ -23,6 +23,7 @@ from dioxide import (
     adapter,
     service,
 )
+from dioxide.container import _protocol_method_names
 
 
 class DescribeConfigAsService:
@@ -193,6 +194,23 @@ class DescribeRegisterInstanceTypeSafety:
         with pytest.raises(TypeError, match='instance must be of type'):
             container.register_instance(EmailPort, BrokenAdapter())
 
+    def it_inspects_each_protocol_once_across_containers(self) -> None:
+        """Protocol method names are collected once and reused by later registrations."""
+
+        class EmailPort(Protocol):
+            def send(self, to: str, message: str) -> None: ...
+
+        class FakeEmailAdapter:
+            def send(self, to: str, message: str) -> None:
+                pass
+
+        Container().register_instance(EmailPort, FakeEmailAdapter())
+        cached = _protocol_method_names[EmailPort]
+        Container().register_instance(EmailPort, FakeEmailAdapter())
+
+        assert cached == ('send',)
+        assert _protocol_method_names[EmailPort] is cached
+
     def it_accepts_abc_implementation(self) -> None:
         """ABC implementations are accepted for the abstract base class type."""
 
@@ -0,0 +1,189 @@
+"""Tests for per-class caching of constructor dependency reflection.
+
+Constructor signatures and type hints are inspected once per class and shared
+by every container, so repeated scans (e.g. one container per test) skip the
+reflection work entirely.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from collections.abc import Callable
+from typing import Protocol
+
+import pytest
+
+from dioxide import (
+    Container,
+    Profile,
+    Scope,
+    adapter,
+    service,
+)
+from dioxide.container import (
+    _constructor_dependencies,
+    _get_constructor_dependencies,
+)
+
+
+class DescribeConstructorDependencies:
+    """Tests for _get_constructor_dependencies()."""
+
+    def it_returns_annotated_parameters_in_signature_order(self) -> None:
+        class Database:
+            pass
+
+        class Cache:
+            pass
+
+        class Repository:
+            def __init__(self, db: Database, cache: Cache, untyped=None) -> None:  # type: ignore[no-untyped-def]
+                pass
+
+        assert _get_constructor_dependencies(Repository) == (('db', Database), ('cache', Cache))
+
+    def it_skips_var_positional_and_var_keyword_parameters(self) -> None:
+        class Database:
+            pass
+
+        class Flexible:
+            def __init__(self, db: Database, *args: Database, **kwargs: Database) -> None:
+                pass
+
+        assert _get_constructor_dependencies(Flexible) == (('db', Database),)
+
+    def it_includes_keyword_only_parameters(self) -> None:
+        class Database:
+            pass
+
+        class Cache:
+            pass
+
+        class Repository:
+            def __init__(self, db: Database, *, cache: Cache) -> None:
+                pass
+
+        assert _get_constructor_dependencies(Repository) == (('db', Database), ('cache', Cache))
+
+    def it_follows_the_wrapped_signature_of_decorated_constructors(self) -> None:
+        class Database:
+            pass
+
+        def logged(init: Callable[..., None]) -> Callable[..., None]:
+            @functools.wraps(init)
+            def wrapper(*args: object, **kwargs: object) -> None:
+                init(*args, **kwargs)
+
+            return wrapper
+
+        class Repository:
+            @logged
+            def __init__(self, db: Database) -> None:
+                pass
+
+        assert _get_constructor_dependencies(Repository) == (('db', Database),)
+
+    def it_skips_type_hint_evaluation_when_annotations_are_classes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        class Database:
+            pass
+
+        class Repository:
+            def __init__(self, db: Database, retries: int = 3) -> None:
+                pass
+
+        # Mimic a module without ``from __future__ import annotations``
+        Repository.__init__.__annotations__ = {'db': Database, 'retries': int, 'return': None}
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError('class annotations should not be re-evaluated')
+
+        monkeypatch.setattr(sys.modules['dioxide.container'], 'get_type_hints', fail)
+
+        assert _get_constructor_dependencies(Repository) == (('db', Database), ('retries', int))
+
+    def it_evaluates_generic_annotations_with_get_type_hints(self) -> None:
+        class Database:
+            pass
+
+        class Pool:
+            def __init__(self, dbs: list[Database], primary: Database) -> None:
+                pass
+
+        Pool.__init__.__annotations__ = {'dbs': list['Database'], 'primary': Database}
+
+        assert _get_constructor_dependencies(Pool) == (('dbs', list[Database]), ('primary', Database))
+
+    def it_caches_the_result_per_class(self) -> None:
+        class Database:
+            pass
+
+        class Repository:
+            def __init__(self, db: Database) -> None:
+                pass
+
+        first = _get_constructor_dependencies(Repository)
+        second = _get_constructor_dependencies(Repository)
+
+        assert second is first
+        assert _constructor_dependencies[Repository] is first
+
+    def it_does_not_cache_unresolvable_type_hints(self) -> None:
+        class Broken:
+            def __init__(self, dep: CompletelyUnknownType) -> None:  # type: ignore[name-defined]  # noqa: F821
+                pass
+
+        with pytest.raises(NameError):
+            _get_constructor_dependencies(Broken)
+
+        assert Broken not in _constructor_dependencies
+
+    def it_shares_reflection_results_across_containers(self) -> None:
+        class StoragePort(Protocol):
+            def save(self) -> None: ...
+
+        @adapter.for_(StoragePort, profile=Profile.TEST)
+        class FakeStorage:
+            def save(self) -> None:
+                pass
+
+        @service
+        class Uploader:
+            def __init__(self, storage: StoragePort) -> None:
+                self.storage = storage
+
+        first = Container(profile=Profile.TEST).resolve(Uploader)
+        cached = _constructor_dependencies[Uploader]
+        second = Container(profile=Profile.TEST).resolve(Uploader)
+
+        assert isinstance(first.storage, FakeStorage)
+        assert isinstance(second.storage, FakeStorage)
+        assert _constructor_dependencies[Uploader] is cached
+
+    def it_does_not_reflect_again_when_resolving_factory_scoped_services(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        class RepositoryPort(Protocol):
+            def get(self) -> None: ...
+
+        @adapter.for_(RepositoryPort, profile=Profile.TEST)
+        class FakeRepository:
+            def get(self) -> None:
+                pass
+
+        @service(scope=Scope.FACTORY)
+        class Handler:
+            def __init__(self, repository: RepositoryPort) -> None:
+                self.repository = repository
+
+        container = Container(profile=Profile.TEST)
+
+        def fail(cls: type) -> None:
+            raise AssertionError('constructor reflection should run once, at scan time')
+
+        # dioxide.container is also the name of the global container, so patch via sys.modules
+        monkeypatch.setattr(sys.modules['dioxide.container'], '_get_constructor_dependencies', fail)
+
+        first = container.resolve(Handler)
+        second = container.resolve(Handler)
+
+        assert first is not second
+        assert isinstance(second.repository, FakeRepository)
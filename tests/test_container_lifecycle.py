@@ -645,3 +645,62 @@ class DescribeContainerLifecycleEdgeCases:
         # Error should mention dependencies couldn't be resolved
         error_msg = str(exc_info.value)
         assert 'dependencies could not be resolved' in error_msg or 'Cannot resolve' in error_msg
+
+    @pytest.mark.asyncio
+    async def it_orders_a_diamond_of_lifecycle_dependencies(self) -> None:
+        """Shared dependencies initialize once, before every dependent."""
+        initialized: list[str] = []
+
+        @service
+        @lifecycle
+        class Database:
+            async def initialize(self) -> None:
+                initialized.append('Database')
+
+            async def dispose(self) -> None:
+                pass
+
+        @service
+        @lifecycle
+        class Cache:
+            def __init__(self, db: Database) -> None:
+                self.db = db
+
+            async def initialize(self) -> None:
+                initialized.append('Cache')
+
+            async def dispose(self) -> None:
+                pass
+
+        @service
+        @lifecycle
+        class Search:
+            def __init__(self, db: Database) -> None:
+                self.db = db
+
+            async def initialize(self) -> None:
+                initialized.append('Search')
+
+            async def dispose(self) -> None:
+                pass
+
+        @service
+        @lifecycle
+        class Application:
+            def __init__(self, cache: Cache, search: Search) -> None:
+                self.cache = cache
+                self.search = search
+
+            async def initialize(self) -> None:
+                initialized.append('Application')
+
+            async def dispose(self) -> None:
+                pass
+
+        container = Container()
+        container.scan()
+        await container.start()
+
+        assert initialized[0] == 'Database'
+        assert sorted(initialized[1:3]) == ['Cache', 'Search']
+        assert initialized[3] == 'Application'
@@ -286,6 +286,35 @@ class DescribeDecoratorOrderDesign:
         assert id(after_adapter) == original2_id
         assert after_adapter is Original2
 
+    def it_demonstrates_decorators_leave_bases_and_methods_untouched(self) -> None:
+        """Decorators add no wrapper bases, methods, or context-manager hooks."""
+
+        class Plain:
+            def __init__(self) -> None:
+                pass
+
+            async def initialize(self) -> None:
+                pass
+
+            async def dispose(self) -> None:
+                pass
+
+            def method(self) -> None:
+                pass
+
+        mro = Plain.__mro__
+        init = Plain.__init__
+        methods = {name for name, value in vars(Plain).items() if callable(value)}
+
+        decorated = service(lifecycle(Plain))
+
+        assert decorated is Plain
+        assert Plain.__mro__ == mro
+        assert Plain.__init__ is init
+        assert {name for name, value in vars(Plain).items() if callable(value)} == methods
+        assert not hasattr(Plain, '__enter__')
+        assert not hasattr(Plain, '__exit__')
+
     def it_demonstrates_decorators_are_commutative(self) -> None:
         """Order of application produces identical results (commutativity)."""
 
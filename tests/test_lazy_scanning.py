@@ -1,6 +1,7 @@
 """Tests for lazy adapter discovery in Container.scan()."""
 
 import sys
+from pathlib import Path
 
 from dioxide import Container
 
@@ -203,6 +204,32 @@ class DescribeLazyScan:
                 sys.modules.pop('bad_pkg.good', None)
 
 
+class DescribeLazyDiscoveryCache:
+    """Tests for reuse of AST discovery results across lazy scans."""
+
+    def it_reuses_parsed_names_for_unchanged_files(self, tmp_path: Path) -> None:
+        from dioxide.container import _lazy_discovered_names
+
+        module = tmp_path / 'adapters.py'
+        module.write_text('@adapter.for_(EmailPort)\nclass SmtpEmail: ...\n')
+
+        first = Container._parse_decorators_from_ast(str(module))
+        _lazy_discovered_names[str(module)] = (*_lazy_discovered_names[str(module)][:2], ('Cached',))
+        second = Container._parse_decorators_from_ast(str(module))
+
+        assert first == ['EmailPort']
+        assert second == ['Cached']
+
+    def it_reparses_files_that_changed(self, tmp_path: Path) -> None:
+        module = tmp_path / 'adapters.py'
+        module.write_text('@adapter.for_(EmailPort)\nclass SmtpEmail: ...\n')
+        Container._parse_decorators_from_ast(str(module))
+
+        module.write_text('@adapter.for_(EmailPort)\nclass SmtpEmail: ...\n@service\nclass Mailer: ...\n')
+
+        assert Container._parse_decorators_from_ast(str(module)) == ['EmailPort', 'Mailer']
+
+
 class DescribeEagerScanBackwardCompatibility:
     """Tests that lazy=False (default) retains eager import behavior."""
 
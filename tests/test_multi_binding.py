@@ -261,6 +261,14 @@ class DescribeMultiBindingEmptyCollection:
         assert isinstance(plugins, list)
         assert len(plugins) == 0
 
+    def it_skips_multi_binding_lookup_for_plain_classes(self) -> None:
+        """Plain classes are never treated as list[Port] hints."""
+
+        container = Container()
+        container.scan(profile=Profile.PRODUCTION)
+
+        assert container._resolve_multi_binding(GremlinOperator) is None
+
 
 class DescribeMultiBindingEdgeCases:
     """Tests for edge cases with multi-bindings."""
@@ -192,6 +192,41 @@ class DescribePackageScanningSecurityValidation:
             container.scan(package='subprocess')
 
 
+class DescribePackageModuleCache:
+    """Tests for reuse of discovered submodule names across scans."""
+
+    def it_reuses_discovered_modules_on_repeat_scans(self) -> None:
+        """A second scan of the same package imports the same modules without re-walking."""
+        from dioxide.container import _package_modules
+
+        first = Container().scan(package='tests.fixtures.test_package_b', stats=True)
+        cached = [
+            modules for (name, _path), modules in _package_modules.items() if name == 'tests.fixtures.test_package_b'
+        ]
+
+        second = Container().scan(package='tests.fixtures.test_package_b', stats=True)
+
+        assert cached == [('tests.fixtures.test_package_b.subpkg',)]
+        assert first is not None
+        assert second is not None
+        assert second.modules_imported == first.modules_imported
+
+    def it_re_registers_components_after_modules_are_unloaded(self) -> None:
+        """Cached module names are re-imported when the modules were removed from sys.modules."""
+        import sys
+
+        Container().scan(package='tests.fixtures.test_package_b')
+        for name in [key for key in sys.modules if key.startswith('tests.fixtures.test_package_b')]:
+            del sys.modules[name]
+
+        container = Container()
+        container.scan(package='tests.fixtures.test_package_b')
+
+        from tests.fixtures.test_package_b.subpkg import ServiceBSub
+
+        assert isinstance(container.resolve(ServiceBSub), ServiceBSub)
+
+
 class DescribePackageScanningErrorHandling:
     """Tests for error handling in package scanning."""
 
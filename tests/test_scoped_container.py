@@ -281,6 +281,42 @@ class DescribeCaptiveDependency:
         assert 'SINGLETON' in error_message
         assert 'REQUEST' in error_message
 
+    def it_skips_detection_when_validation_is_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """DIOXIDE_SKIP_VALIDATION turns off the scan-time captive check."""
+        monkeypatch.setenv('DIOXIDE_SKIP_VALIDATION', '1')
+
+        @service(scope=Scope.REQUEST)
+        class RequestContext:
+            pass
+
+        @service  # SINGLETON
+        class SingletonService:
+            def __init__(self, ctx: RequestContext) -> None:
+                self.ctx = ctx
+
+        container = Container()
+        container.scan()  # Should not raise
+
+        assert container.is_registered(SingletonService)
+
+    def it_still_detects_when_validation_flag_is_zero(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """DIOXIDE_SKIP_VALIDATION=0 keeps validation enabled."""
+        monkeypatch.setenv('DIOXIDE_SKIP_VALIDATION', '0')
+
+        @service(scope=Scope.REQUEST)
+        class RequestContext:
+            pass
+
+        @service  # SINGLETON
+        class SingletonService:
+            def __init__(self, ctx: RequestContext) -> None:
+                self.ctx = ctx
+
+        container = Container()
+
+        with pytest.raises(CaptiveDependencyError):
+            container.scan()
+
     @pytest.mark.asyncio
     async def it_allows_request_to_depend_on_singleton(self) -> None:
         """REQUEST depending on SINGLETON is valid (no captive)."""
@@ -109,6 +109,27 @@ class DescribeServiceDecorator:
         instance = container.resolve(ServiceWithoutInit)
         assert isinstance(instance, ServiceWithoutInit)
 
+    def it_supports_classes_that_declare_slots(self) -> None:
+        """Decorator works with classes that opt into __slots__."""
+
+        @service
+        class Clock:
+            pass
+
+        @service
+        class SlottedService:
+            __slots__ = ('_clock',)
+
+            def __init__(self, clock: Clock) -> None:
+                self._clock = clock
+
+        container = Container()
+        container.scan()
+
+        instance = container.resolve(SlottedService)
+        assert isinstance(instance._clock, Clock)
+        assert not hasattr(instance, '__dict__')
+
 
 class DescribeServiceScope:
     """Tests for @service decorator scope behavior."""
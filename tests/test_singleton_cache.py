@@ -0,0 +1,149 @@
+"""Tests for the Python-side singleton cache in Container.resolve().
+
+Once a singleton has been built, later resolve() calls return it from a
+plain dict lookup instead of crossing into the Rust core again.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from dioxide import (
+    Container,
+    Scope,
+    reset_global_container,
+    service,
+)
+from dioxide import container as global_container
+
+
+class DescribeSingletonCache:
+    """Tests for Container._singleton_cache."""
+
+    def it_caches_singletons_after_first_resolution(self) -> None:
+        @service
+        class Settings:
+            pass
+
+        container = Container()
+        container.scan()
+
+        first = container.resolve(Settings)
+
+        assert container._singleton_cache[Settings] is first
+        assert container.resolve(Settings) is first
+
+    def it_does_not_cache_factory_scoped_components(self) -> None:
+        @service(scope=Scope.FACTORY)
+        class Transaction:
+            pass
+
+        container = Container()
+        container.scan()
+
+        first = container.resolve(Transaction)
+        second = container.resolve(Transaction)
+
+        assert first is not second
+        assert Transaction not in container._singleton_cache
+
+    def it_caches_registered_instances(self) -> None:
+        class Config:
+            pass
+
+        config = Config()
+        container = Container()
+        container.register_instance(Config, config)
+
+        assert container.resolve(Config) is config
+        assert container._singleton_cache[Config] is config
+
+    def it_caches_singleton_factories_that_return_none(self) -> None:
+        class Missing:
+            pass
+
+        calls: list[None] = []
+
+        def build_missing() -> Any:
+            calls.append(None)
+            return None
+
+        container = Container()
+        container.register_singleton_factory(Missing, build_missing)
+
+        assert container.resolve(Missing) is None
+        assert container.resolve(Missing) is None
+        assert len(calls) == 1
+
+    def it_is_cleared_by_reset(self) -> None:
+        @service
+        class Settings:
+            pass
+
+        container = Container()
+        container.scan()
+        first = container.resolve(Settings)
+
+        container.reset()
+
+        assert container._singleton_cache == {}
+        assert container.resolve(Settings) is not first
+
+    def it_is_cleared_by_reset_global_container(self) -> None:
+        @service
+        class Settings:
+            pass
+
+        global_container.scan()
+        global_container.resolve(Settings)
+
+        reset_global_container()
+
+        assert global_container._singleton_cache == {}
+        assert global_container._singleton_types == set()
+
+    @pytest.mark.asyncio
+    async def it_serves_scoped_singleton_resolution_from_the_parent_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        @service
+        class UserService:
+            pass
+
+        container = Container()
+        container.scan()
+        first = container.resolve(UserService)
+
+        def fail(component_type: type) -> None:
+            raise AssertionError('cached singleton should not reach Container.resolve')
+
+        monkeypatch.setattr(container, 'resolve', fail)
+
+        async with container.create_scope() as scope:
+            assert scope.resolve(UserService) is first
+
+    def it_injects_cached_singletons_into_factories_without_resolving_them(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        @service
+        class Settings:
+            pass
+
+        @service(scope=Scope.FACTORY)
+        class Handler:
+            def __init__(self, settings: Settings) -> None:
+                self.settings = settings
+
+        container = Container()
+        container.scan()
+        settings = container.resolve(Settings)
+        build_handler = container._transient_factories[Handler]
+
+        def fail(component_type: type) -> None:
+            raise AssertionError('cached singleton dependency should not reach Container.resolve')
+
+        monkeypatch.setattr(container, 'resolve', fail)
+
+        assert build_handler().settings is settings
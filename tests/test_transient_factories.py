@@ -0,0 +1,125 @@
+"""Tests for the Python-side dispatch of FACTORY-scoped providers.
+
+Container.resolve() calls transient factories directly instead of going
+through the Rust core, while keeping the Rust core's error contract.
+"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+import pytest
+
+from dioxide import (
+    Container,
+    Profile,
+    Scope,
+    adapter,
+    reset_global_container,
+    service,
+)
+from dioxide import container as global_container
+from dioxide.exceptions import (
+    ScopeError,
+    ServiceNotFoundError,
+)
+
+
+class _RustCoreUnavailable:
+    """Stand-in Rust core that fails if resolve() reaches it."""
+
+    def resolve(self, component_type: type) -> None:
+        raise AssertionError('FACTORY-scoped resolution should not reach the Rust core')
+
+
+class DescribeTransientFactories:
+    """Tests for Container._transient_factories."""
+
+    def it_calls_factory_scoped_services_without_the_rust_core(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        class ClockPort(Protocol):
+            def now(self) -> int: ...
+
+        @adapter.for_(ClockPort, profile=Profile.TEST)
+        class FakeClock:
+            def now(self) -> int:
+                return 0
+
+        @service(scope=Scope.FACTORY)
+        class Handler:
+            def __init__(self, clock: ClockPort) -> None:
+                self.clock = clock
+
+        container = Container(profile=Profile.TEST)
+        clock = container.resolve(ClockPort)
+        monkeypatch.setattr(container, '_rust_core', _RustCoreUnavailable())
+
+        first = container.resolve(Handler)
+        second = container.resolve(Handler)
+
+        assert first is not second
+        assert first.clock is clock
+        assert isinstance(clock, FakeClock)
+
+    def it_records_manually_registered_transient_factories(self) -> None:
+        class Token:
+            pass
+
+        container = Container()
+        container.register_transient_factory(Token, Token)
+
+        assert container._transient_factories[Token] is Token
+        assert container.resolve(Token) is not container.resolve(Token)
+
+    def it_leaves_request_scoped_services_to_the_scope_check(self) -> None:
+        @service(scope=Scope.REQUEST)
+        class RequestContext:
+            pass
+
+        container = Container()
+        container.scan()
+
+        assert RequestContext not in container._transient_factories
+        with pytest.raises(ScopeError):
+            container.resolve(RequestContext)
+
+    def it_reports_failing_factories_like_the_rust_core(self) -> None:
+        class Broken:
+            pass
+
+        def explode() -> Broken:
+            raise ValueError('boom')
+
+        container = Container()
+        container.register_transient_factory(Broken, explode)
+
+        with pytest.raises(ServiceNotFoundError):
+            container.resolve(Broken)
+
+    def it_reports_missing_transitive_dependencies(self) -> None:
+        class MissingPort(Protocol):
+            def call(self) -> None: ...
+
+        @service(scope=Scope.FACTORY)
+        class NeedsMissing:
+            def __init__(self, dep: MissingPort) -> None:
+                self.dep = dep
+
+        container = Container()
+        container.scan()
+
+        with pytest.raises(ServiceNotFoundError, match=r'NeedsMissing -> dep: MissingPort'):
+            container.resolve(NeedsMissing)
+
+    def it_is_cleared_by_reset_global_container(self) -> None:
+        @service(scope=Scope.FACTORY)
+        class Widget:
+            pass
+
+        global_container.scan()
+        assert Widget in global_container._transient_factories
+
+        reset_global_container()
+
+        assert global_container._transient_factories == {}
+        with pytest.raises(ServiceNotFoundError):
+            global_container.resolve(Widget)